@@ -0,0 +1,86 @@
+"""
+Cost of frame capture on the game thread.
+
+The game is run for the same frames without capture, with the naive
+pygame.image.tostring copy, and through FrameCapture writing raw and
+zlib-compressed chunks to a temporary directory. The script prints the
+extra time per frame spent on the game thread, the frames dropped, and
+checks that the frames read back from disk match the screen pixel for pixel.
+"""
+import glob
+import os
+import random
+import tempfile
+import time
+
+from common import init_headless
+
+screen = init_headless()
+import pygame
+from controllers.game_controller import GameController
+from capture import FrameCapture, read_chunk, frame_view
+
+FRAMES = 300
+SLOTS = 8
+
+
+def play(mode, directory=None, compress_level=0):
+    random.seed(5)
+    controller = GameController(screen)
+    controller.governor = None
+    recorder = None
+    if mode == "capture":
+        recorder = FrameCapture(True, slots=SLOTS, chunk_frames=100, compress_level=compress_level)
+        recorder.start(screen, directory)
+    expected = {}
+    capture_seconds = 0.0
+    for i in range(FRAMES):
+        if i % 12 == 0:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        controller.handle_events()
+        controller.update()
+        controller.renderer.render(controller.render_layers, controller.player, controller.camera_x,
+                                   controller.game_over, controller.win, controller.endpoint_message,
+                                   controller.font, controller.title_font)
+        start = time.perf_counter()
+        if mode == "tostring":
+            pygame.image.tostring(screen, "RGB")
+        elif recorder:
+            recorder.frame(screen, i)
+        capture_seconds += time.perf_counter() - start
+        if recorder and i % 50 == 0:
+            expected[i] = pygame.image.tostring(screen, "RGB")
+        # Pace like the game loop so the writer has a frame's time per frame
+        time.sleep(1 / 120)
+    if recorder:
+        recorder.stop()
+    return capture_seconds / FRAMES * 1000, recorder, expected
+
+
+def verify(directory, expected):
+    seen = 0
+    for path in sorted(glob.glob(os.path.join(directory, "*", "chunk-*.bin"))):
+        for tick, surface in read_chunk(path):
+            if tick in expected:
+                if pygame.image.tostring(surface, "RGB") != expected[tick]:
+                    return "frame %d differs" % tick
+                seen += 1
+    return "%d sampled frames identical" % seen if seen == len(expected) else "frames missing"
+
+
+def main():
+    ms, _, _ = play("tostring")
+    print(f"tostring copy       {ms:6.3f} ms/frame on the game thread")
+    for label, level in (("capture raw", 0), ("capture zlib", 1)):
+        with tempfile.TemporaryDirectory() as directory:
+            ms, recorder, expected = play("capture", directory, level)
+            print(f"{label:19s} {ms:6.3f} ms/frame on the game thread, "
+                  f"{recorder.bytes_written / recorder.written / 1e3:7.1f} kB/frame, "
+                  f"{recorder.dropped} of {FRAMES} dropped; {verify(directory, expected)}")
+    view = frame_view(screen)
+    print("frame_view returns a", type(view).__name__)
+    del view
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Cost of player/monster contact checks.
+
+rect:        pygame.sprite.spritecollide on bounding rects (the old check)
+rect+mask:   rect broad phase, then cached masks for every candidate
+game:        harmful_contact as the game calls it: masks only for live
+             monsters, up to the first overlap, and no check at all while
+             the player is invulnerable (INVULN_TIME ticks after every hit)
+naive mask:  spritecollide with collide_mask and masks built on every call
+
+Monsters are scattered around the player with random animation frames and
+facings; one in ten is dying. The script also counts how many rect hits the
+masks reject, i.e. contacts that used to register through transparent padding.
+"""
+import random
+
+from common import init_headless, timed
+
+init_headless()
+import pygame
+from models.player import Player
+from models.monster import Monster
+from helper import flip_image
+from models.collision import mask_hits, harmful_contact
+
+MONSTERS = [10, 100, 1000]
+CHECKS = 200
+
+
+class Unmasked(pygame.sprite.Sprite):
+    """Same image and rect, but no cached mask: collide_mask builds one each call."""
+    def __init__(self, sprite):
+        super().__init__()
+        self.image = sprite.image
+        self.rect = sprite.rect
+
+
+def scatter(count, player, rng):
+    template = Monster((0, 0))
+    frames = template.walk_frames + template.attack_frames
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        # Build monsters without Monster.__init__ to skip loading 21 images each
+        monster = Monster.__new__(Monster)
+        pygame.sprite.Sprite.__init__(monster)
+        image = rng.choice(frames)
+        monster.image = flip_image(image) if rng.random() < 0.5 else image
+        monster.rect = template.rect.copy()
+        monster._mask_image = None
+        monster.is_dying = rng.random() < 0.1
+        monster.rect.center = (player.rect.centerx + rng.randint(-60, 60),
+                               player.rect.centery + rng.randint(-60, 60))
+        group.add(monster)
+    return group
+
+
+def rect_only(player, group):
+    for _ in range(CHECKS):
+        pygame.sprite.spritecollide(player, group, False)
+
+
+def rect_then_mask(player, group):
+    for _ in range(CHECKS):
+        mask_hits(player, pygame.sprite.spritecollide(player, group, False))
+
+
+def game_check(player, group):
+    for _ in range(CHECKS):
+        harmful_contact(player, group)
+
+
+def naive_mask(player, group):
+    for _ in range(CHECKS):
+        pygame.sprite.spritecollide(player, group, False, pygame.sprite.collide_mask)
+
+
+def main():
+    rng = random.Random(3)
+    player = Player((500, 270))
+    unmasked_player = Unmasked(player)
+    print(f"{'monsters':>9} {'rect us':>8} {'rect+mask us':>13} {'game us':>8} {'game invuln us':>15} "
+          f"{'naive mask us':>14} {'rect hits':>10} {'rejected':>9}")
+    for count in MONSTERS:
+        group = scatter(count, player, rng)
+        unmasked = pygame.sprite.Group(Unmasked(m) for m in group)
+        rect_hits = pygame.sprite.spritecollide(player, group, False)
+        rejected = len(rect_hits) - len(mask_hits(player, rect_hits))
+        t_rect = timed(rect_only, player, group) / CHECKS * 1e6
+        t_mask = timed(rect_then_mask, player, group) / CHECKS * 1e6
+        player.invuln_timer = 0
+        t_game = timed(game_check, player, group) / CHECKS * 1e6
+        player.invuln_timer = 1
+        t_invuln = timed(game_check, player, group) / CHECKS * 1e6
+        player.invuln_timer = 0
+        t_naive = timed(naive_mask, unmasked_player, unmasked, repeat=1) / CHECKS * 1e6
+        print(f"{count:>9} {t_rect:>8.1f} {t_mask:>13.1f} {t_game:>8.1f} {t_invuln:>15.1f} "
+              f"{t_naive:>14.1f} {len(rect_hits):>10} {rejected:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Run a long headless trip through the endless dungeon.
+
+The camera moves one maze column per step and DungeonStream generates and
+evicts columns around it. At regular checkpoints the script prints the
+time per column, the number of columns and walls kept, and the process's
+peak memory, which should all stay flat however far the trip goes.
+
+Before that, full GameController games are run in endless mode, with the
+player standing still and with the player moving right, to check that
+monsters and items never leave the kept columns.
+
+    python benchmarks/bench_endless.py [columns]   (default 1,000,000)
+"""
+import random
+import resource
+import sys
+import time
+
+from common import init_headless
+
+screen = init_headless()
+from config import MAZE_ROWS, MAZE_CELL_SIZE
+from models.endless import DungeonStream
+import controllers.game_controller as game_controller
+
+CHECKPOINTS = 10
+SEEDS = 5
+TICKS = 4000
+
+
+def check_entities(speed):
+    """Play endless games with the player moving `speed` px per tick; count entities outside the maze."""
+    game_controller.ENDLESS_MODE = True
+    outside = seen = 0
+    for seed in range(SEEDS):
+        random.seed(seed)
+        controller = game_controller.GameController(screen)
+        controller.governor = None
+        controller.keys = type("NoKeys", (), {"__getitem__": lambda self, key: False})()
+        stream = controller.stream
+        for _ in range(TICKS):
+            controller.update()
+            controller.player.rect.x += speed
+            controller.player.invuln_timer = 1
+            right = stream.next_col * MAZE_CELL_SIZE
+            for group in (controller.monster_group, controller.key_group, controller.powerup_group):
+                for sprite in group:
+                    seen += 1
+                    if sprite.rect.left < stream.left or sprite.rect.right > right:
+                        outside += 1
+    game_controller.ENDLESS_MODE = False
+    return outside, seen, stream.first_col
+
+
+def main():
+    for label, speed in (("player still", 0), ("player moving right", 2)):
+        outside, seen, first_col = check_entities(speed)
+        print(f"{label}: {outside} of {seen} entity-ticks outside the kept columns "
+              f"({SEEDS} seeds x {TICKS} ticks, last game ended at column {first_col})")
+    columns = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    stream = DungeonStream(MAZE_ROWS, seed=1)
+    step = max(1, columns // CHECKPOINTS)
+    print(f"{'column':>9} {'us/column':>10} {'kept cols':>10} {'walls':>6} {'grid cells':>11} {'max RSS MB':>11}")
+    last = time.perf_counter()
+    for col in range(1, columns + 1):
+        stream.advance(col * MAZE_CELL_SIZE)
+        if col % step == 0:
+            now = time.perf_counter()
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{col:>9} {(now - last) / step * 1e6:>10.2f} {len(stream.columns):>10} "
+                  f"{len(stream.wall_group):>6} {len(stream.wall_grid.cells):>11} {rss:>11.1f}")
+            last = now
+
+
+if __name__ == "__main__":
+    main()
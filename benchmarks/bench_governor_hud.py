@@ -0,0 +1,59 @@
+"""
+Cost of the HUD at the refresh intervals the frame governor can choose.
+
+Interval 1 lays out and draws the HUD every frame; larger intervals
+rebuild the HUD's blit list every n frames and replay it in between.
+The script times the HUD layer alone for a few HUD states and checks that
+the cached HUD puts the same pixels on screen as the direct one.
+"""
+import time
+
+from common import init_headless
+
+screen = init_headless()
+import pygame
+from config import PLAYER_LIVES
+from controllers.game_controller import GameController
+from views.renderer import HudState
+
+FRAMES = 3000
+INTERVALS = (1, 2, 4, 8)
+STATES = (("3 lives", 3, 0), ("3 lives, powerup", 3, 600), (f"{PLAYER_LIVES} lives, powerup", PLAYER_LIVES, 600))
+
+
+def hud_state(lives, powerup_timer):
+    return HudState(lives, False, True, powerup_timer, (0, 0), pygame.math.Vector2(1, 0), 40)
+
+
+def time_hud(renderer, font, hud, interval):
+    renderer.hud_interval = interval
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        renderer.frame_count += 1
+        renderer.draw_hud_layer(hud, font)
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def hud_pixels(renderer, font, hud, interval):
+    screen.fill((0, 0, 0))
+    renderer.hud_interval = interval
+    renderer.frame_count = 0
+    renderer.draw_hud_layer(hud, font)
+    width, height = renderer.hud_row_width(PLAYER_LIVES), renderer.hud_height
+    return pygame.image.tostring(screen.subsurface((screen.get_width() - width, 0, width, height)), "RGB")
+
+
+def main():
+    controller = GameController(screen)
+    renderer, font = controller.renderer, controller.font
+    print(f"{'HUD':>22} " + " ".join(f"{'every ' + str(i):>9}" for i in INTERVALS) + "   (us/frame)")
+    for label, lives, powerup in STATES:
+        hud = hud_state(lives, powerup)
+        times = [time_hud(renderer, font, hud, interval) for interval in INTERVALS]
+        same = hud_pixels(renderer, font, hud, 1) == hud_pixels(renderer, font, hud, 2)
+        print(f"{label:>22} " + " ".join(f"{t:>9.1f}" for t in times)
+              + ("" if same else "   cached HUD differs"))
+
+
+if __name__ == "__main__":
+    main()
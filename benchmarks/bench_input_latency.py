@@ -0,0 +1,78 @@
+"""
+Measure input-to-display latency with the three ways of pacing the loop.
+
+A thread presses SPACE at random moments while the game runs with
+Clock.tick, Clock.tick_busy_loop and the late-polling LatePollPacer. Each
+press spawns a fist in the tick that reads it, and InputLatency times it
+from the moment the press was posted to the flip that shows that tick.
+The dummy video driver presents at once, so display.flip is replaced by
+one that blocks until the next refresh of a simulated 60 Hz vsync display.
+"""
+import random
+import threading
+import time
+
+from common import init_headless
+
+screen = init_headless()
+import pygame
+from config import FPS
+from controllers.game_controller import GameController
+from controllers.input_latency import InputLatency, LatePollPacer
+
+SECONDS = 5
+REFRESH = 1.0 / 60
+EPOCH = time.perf_counter()
+present = pygame.display.flip
+
+
+def vsync_flip():
+    """Block until the next vertical blank, like a vsync flip on real hardware."""
+    now = time.perf_counter()
+    vblank = EPOCH + (int((now - EPOCH) / REFRESH) + 1) * REFRESH
+    time.sleep(max(0.0, vblank - now - 0.001))
+    while time.perf_counter() < vblank:
+        pass
+    present()
+
+
+def press_keys(stop):
+    rng = random.Random(7)
+    while not stop.is_set():
+        time.sleep(rng.uniform(0.05, 0.15))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, time=time.perf_counter()))
+
+
+def play(pacing):
+    random.seed(1)
+    controller = GameController(screen, InputLatency())
+    controller.governor = None
+    pacer = LatePollPacer(vsync=True)
+    stop = threading.Event()
+    presser = threading.Thread(target=press_keys, args=(stop,))
+    presser.start()
+    for _ in range(SECONDS * FPS):
+        if pacing == "late poll":
+            pacer.wait()
+            start = time.perf_counter()
+            controller.step()
+            pacer.frame_done(controller.flip_started - start)
+        else:
+            controller.step()
+            if pacing == "tick":
+                controller.clock.tick(FPS)
+            else:
+                controller.clock.tick_busy_loop(FPS)
+    stop.set()
+    presser.join()
+    return controller.latency.report()
+
+
+def main():
+    pygame.display.flip = vsync_flip
+    for pacing in ("tick", "tick_busy_loop", "late poll"):
+        print(f"{pacing:15s} {play(pacing)}")
+
+
+if __name__ == "__main__":
+    main()
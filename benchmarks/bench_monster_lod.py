@@ -0,0 +1,75 @@
+"""
+Compare full monster simulation with the level-of-detail tiers.
+
+The same monster population is run through a wide maze with the camera
+at the left edge: with Monster.update for every monster, through
+MonsterLOD, and through MonsterLOD with swarming, which only steers the
+fully simulated monsters. The script prints per-tick cost and a few
+behaviour statistics that should stay close between the runs.
+"""
+import random
+import sys
+import time
+
+from common import init_headless, maze_wall_boxes
+
+init_headless()
+import pygame
+from config import MAZE_CELL_SIZE, WALL_THICKNESS
+from models.maze import generate_maze
+from models.monster import Monster
+from models.collision import WallGrid
+from controllers.monster_lod import MonsterLOD
+from models.swarm import Swarm
+
+COLS, ROWS = 60, 6
+NUM_MONSTERS = 300
+TICKS = 600
+
+
+def spawn(seed):
+    random.seed(seed)
+    group = pygame.sprite.Group()
+    for _ in range(NUM_MONSTERS):
+        col, row = random.randrange(COLS), random.randrange(ROWS)
+        group.add(Monster((col * MAZE_CELL_SIZE + MAZE_CELL_SIZE // 2,
+                           row * MAZE_CELL_SIZE + MAZE_CELL_SIZE // 2)))
+    return group
+
+
+def run(group, walls, grid, lod, swarm=None):
+    random.seed(99)
+    start_pos = {m: m.rect.center for m in group}
+    attacking = 0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        if lod:
+            lod.update(group, walls, grid, 0, swarm=swarm)
+        else:
+            for monster in group:
+                monster.update(walls)
+        attacking += sum(m.is_attacking for m in group)
+    elapsed = time.perf_counter() - start
+    moved = [abs(m.rect.centerx - start_pos[m][0]) + abs(m.rect.centery - start_pos[m][1]) for m in group]
+    in_walls = sum(1 for m in group if m.rect.collidelist([w.rect for w in walls]) != -1)
+    return elapsed, sum(moved) / len(moved), attacking / (TICKS * len(group)), in_walls
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    random.seed(7)
+    maze = generate_maze(COLS, ROWS)
+    walls = maze_wall_boxes(maze, MAZE_CELL_SIZE, WALL_THICKNESS)
+    grid = WallGrid(walls, MAZE_CELL_SIZE)
+    print(f"{NUM_MONSTERS} monsters, {TICKS} ticks, {len(walls)} walls")
+    print(f"{'mode':>6} {'ms/tick':>8} {'mean moved px':>14} {'attacking':>10} {'in walls':>9}")
+    for name, lod, swarm in (("full", None, None), ("lod", MonsterLOD(), None),
+                             ("swarm", MonsterLOD(), Swarm())):
+        elapsed, moved, attacking, in_walls = run(spawn(42), walls, grid, lod, swarm)
+        print(f"{name:>6} {elapsed / TICKS * 1000:>8.3f} {moved:>14.1f} {attacking:>10.3f} {in_walls:>9}")
+        if lod:
+            print(lod.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare discrete and swept projectile-vs-wall collision.
+
+For each projectile speed, random arrows are fired through a maze and the
+number of walls each method misses (tunnelling) is counted against a
+brute-force swept reference. The swept grid walk must never disagree with
+the reference; the script exits with an error if it does.
+"""
+import math
+import random
+import sys
+
+from common import init_headless, maze_wall_boxes, timed
+
+init_headless()
+import pygame
+from config import MAZE_CELL_SIZE, WALL_THICKNESS, PLAYER_SIZE
+from models.maze import generate_maze
+from models.collision import WallGrid, sweep_rect
+
+COLS, ROWS = 40, 12
+NUM_ARROWS = 2000
+SPEEDS = [12.5, 25, 50, 200, 1000]
+
+
+def make_arrows(walls, speed, rng):
+    arrows = []
+    while len(arrows) < NUM_ARROWS:
+        rect = pygame.Rect(0, 0, PLAYER_SIZE // 2, PLAYER_SIZE // 4)
+        rect.center = (rng.uniform(0, COLS * MAZE_CELL_SIZE), rng.uniform(0, ROWS * MAZE_CELL_SIZE))
+        if rect.collidelist([w.rect for w in walls]) != -1:
+            continue
+        angle = rng.uniform(0, 2 * math.pi)
+        arrows.append((rect, int(math.cos(angle) * speed), int(math.sin(angle) * speed)))
+    return arrows
+
+
+def discrete(arrows, walls):
+    # Old behaviour: move, then test the end position against every wall
+    hits = []
+    for rect, dx, dy in arrows:
+        moved = rect.move(dx, dy)
+        hits.append(any(moved.colliderect(w.rect) for w in walls))
+    return hits
+
+
+def swept(arrows, grid):
+    return [grid.sweep(rect, dx, dy)[0] for rect, dx, dy in arrows]
+
+
+def reference(arrows, walls):
+    results = []
+    for rect, dx, dy in arrows:
+        times = [t for t in (sweep_rect(rect, dx, dy, w.rect) for w in walls) if t is not None]
+        results.append(min(times) if times else None)
+    return results
+
+
+def main():
+    sys.setrecursionlimit(10000)
+    rng = random.Random(1234)
+    random.seed(1234)
+    maze = generate_maze(COLS, ROWS)
+    walls = maze_wall_boxes(maze, MAZE_CELL_SIZE, WALL_THICKNESS)
+    grid = WallGrid(walls, MAZE_CELL_SIZE)
+    print(f"maze {COLS}x{ROWS}, {len(walls)} walls, {NUM_ARROWS} arrows per speed")
+    print(f"{'speed':>7} {'hits':>6} {'discrete missed':>16} {'swept missed':>13} "
+          f"{'discrete ms':>12} {'swept ms':>9}")
+    failed = False
+    for speed in SPEEDS:
+        arrows = make_arrows(walls, speed, rng)
+        truth = reference(arrows, walls)
+        d_hits = discrete(arrows, walls)
+        s_hits = swept(arrows, grid)
+        n_hits = sum(t is not None for t in truth)
+        d_missed = sum(t is not None and not d for t, d in zip(truth, d_hits))
+        s_wrong = sum(t != s for t, s in zip(truth, s_hits))
+        failed |= s_wrong > 0
+        d_time = timed(discrete, arrows, walls) * 1000
+        s_time = timed(swept, arrows, grid) * 1000
+        print(f"{speed:>7} {n_hits:>6} {d_missed:>16} {s_wrong:>13} {d_time:>12.2f} {s_time:>9.2f}")
+    if failed:
+        sys.exit("swept collision disagrees with the brute-force reference")
+
+
+if __name__ == "__main__":
+    main()
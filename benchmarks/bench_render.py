@@ -0,0 +1,63 @@
+"""
+Measure sprite blit throughput of the old and new drawing paths.
+
+before: one screen.blit call per sprite, images from convert_alpha()
+        with a colorkey on top (what load_image used to return)
+after:  one screen.blits call per layer, images from load_image
+        (display format with an RLE-accelerated colorkey)
+"""
+import random
+
+from common import init_headless, timed
+
+screen = init_headless()
+import pygame
+from config import MONSTER_SIZE, MAZE_CELL_SIZE, WALL_THICKNESS, SCREEN_WIDTH, SCREEN_HEIGHT
+from helper import load_image
+
+FRAMES = 50
+SPRITE_COUNTS = [100, 500, 2000]
+ASSETS = [(f"assets/monster-walk/{i}.png", (MONSTER_SIZE, MONSTER_SIZE)) for i in range(1, 9)] + [
+    ("assets/wall.png", (WALL_THICKNESS, MAZE_CELL_SIZE)),
+    ("assets/wall-h.png", (MAZE_CELL_SIZE, WALL_THICKNESS + 10)),
+]
+
+
+def old_load_image(path, size):
+    image = pygame.image.load(path).convert_alpha()
+    image = pygame.transform.scale(image, size)
+    image.set_colorkey((40, 40, 40))
+    return image
+
+
+def make_draw_list(images, count, rng):
+    return [(rng.choice(images), (rng.randrange(SCREEN_WIDTH), rng.randrange(SCREEN_HEIGHT)))
+            for _ in range(count)]
+
+
+def draw_before(draw_list):
+    for _ in range(FRAMES):
+        for image, pos in draw_list:
+            screen.blit(image, pos)
+
+
+def draw_after(draw_list):
+    for _ in range(FRAMES):
+        screen.blits(draw_list, doreturn=False)
+
+
+def main():
+    rng = random.Random(5)
+    old_images = [old_load_image(path, size) for path, size in ASSETS]
+    new_images = [load_image(path, size) for path, size in ASSETS]
+    print(f"{'sprites':>8} {'before blits/s':>15} {'after blits/s':>14} {'speedup':>8}")
+    for count in SPRITE_COUNTS:
+        before = timed(draw_before, make_draw_list(old_images, count, rng), repeat=3)
+        after = timed(draw_after, make_draw_list(new_images, count, rng), repeat=3)
+        rate_before = count * FRAMES / before
+        rate_after = count * FRAMES / after
+        print(f"{count:>8} {rate_before:>15.0f} {rate_after:>14.0f} {rate_after / rate_before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
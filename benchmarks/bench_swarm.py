@@ -0,0 +1,104 @@
+"""
+Per-tick cost of monster separation/swarming as the population grows.
+
+Monsters are scattered twice: at constant density (area grows with the
+population) and packed into one fixed area (density grows with it). With
+the neighbour grid and the per-monster check cap, cost per monster should
+stay roughly flat in both cases, i.e. total per-tick cost is linear.
+
+A last check packs a clump of monsters marching the same way so tightly
+that most of them overlap, and counts the overlapping pairs as the clump
+moves, with and without separation.
+"""
+import math
+import random
+import time
+
+from common import init_headless
+
+init_headless()
+import pygame
+from config import MONSTER_SIZE, MONSTER_SPEED, SEPARATION_RADIUS
+from models.swarm import Swarm
+
+SIZES = (500, 1000, 2000, 4000, 8000)
+TICKS = 50
+DENSITY_AREA = 150 * 150      # area per monster in the constant-density case
+PACKED_SIZE = 1200            # side of the fixed area in the packed case
+CLUSTER = 40                  # monsters in the overlapping clump
+CLUSTER_SIZE = 2 * MONSTER_SIZE
+CLUSTER_TICKS = (0, 15, 30, 60, 120)
+
+
+class Walker:
+    """Just the attributes Swarm.steer reads from a Monster."""
+    def __init__(self, x, y, rng, angle=None):
+        self.rect = pygame.Rect(0, 0, MONSTER_SIZE, MONSTER_SIZE)
+        self.rect.center = (x, y)
+        if angle is None:
+            angle = rng.uniform(0, 2 * math.pi)
+        self.velocity = pygame.math.Vector2(math.cos(angle), math.sin(angle)) * MONSTER_SPEED
+        self.is_dying = False
+        self.is_attacking = False
+        self.knockback_timer = 0
+
+
+def move(walkers):
+    for w in walkers:
+        w.rect.x += round(w.velocity.x)
+        w.rect.y += round(w.velocity.y)
+
+
+def overlapping_pairs(walkers):
+    centres = [w.rect.center for w in walkers]
+    return sum(1 for i, (x, y) in enumerate(centres) for ox, oy in centres[i + 1:]
+               if (x - ox) ** 2 + (y - oy) ** 2 < SEPARATION_RADIUS ** 2)
+
+
+def cluster(swarm):
+    """Overlapping pairs in a clump marching east, at each of CLUSTER_TICKS."""
+    rng = random.Random(CLUSTER)
+    walkers = [Walker(1000 + rng.randint(0, CLUSTER_SIZE), 1000 + rng.randint(0, CLUSTER_SIZE), rng, 0)
+               for _ in range(CLUSTER)]
+    # A few exactly stacked on another, as when they spawn in the same cell
+    for w, other in zip(walkers[:4], walkers[4:8]):
+        w.rect.center = other.rect.center
+    pairs = []
+    for tick in range(CLUSTER_TICKS[-1] + 1):
+        if tick in CLUSTER_TICKS:
+            pairs.append(overlapping_pairs(walkers))
+        swarm.steer(walkers)
+        move(walkers)
+    return pairs
+
+
+def run(n, side):
+    rng = random.Random(n)
+    walkers = [Walker(rng.uniform(0, side), rng.uniform(0, side), rng) for _ in range(n)]
+    swarm = Swarm()
+    checks = 0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        swarm.steer(walkers)
+        checks += swarm.checks
+        move(walkers)
+    elapsed = (time.perf_counter() - start) / TICKS
+    return elapsed, checks / TICKS / n
+
+
+def main():
+    for label, side_for in (("constant density", lambda n: int(math.sqrt(n * DENSITY_AREA))),
+                            ("packed %dx%d" % (PACKED_SIZE, PACKED_SIZE), lambda n: PACKED_SIZE)):
+        print(label)
+        for n in SIZES:
+            per_tick, checks = run(n, side_for(n))
+            print(f"  {n:5d} monsters: {per_tick * 1000:7.2f} ms/tick  "
+                  f"{per_tick * 1e6 / n:5.2f} us/monster  {checks:4.1f} checks/monster")
+    print(f"clump of {CLUSTER} overlapping monsters, overlapping pairs after "
+          + ", ".join(str(t) for t in CLUSTER_TICKS) + " ticks")
+    for label, swarm in (("no separation", Swarm(separation=0)), ("separation", Swarm())):
+        print(f"  {label:>13}: " + " ".join(f"{p:4d}" for p in cluster(swarm)))
+
+
+if __name__ == "__main__":
+    main()
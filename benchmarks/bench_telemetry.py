@@ -0,0 +1,52 @@
+"""
+Measure telemetry overhead.
+
+Times the cost of a record() call and of a realistic tick (one tick record
+plus a few events), and compares it with the frame budget. The flush thread
+runs while the records are written, as it does in the game.
+"""
+import os
+import tempfile
+
+from common import init_headless, timed
+
+init_headless()
+from config import FPS
+from telemetry import Telemetry, TICK, MONSTER_HIT, read_records
+
+CALLS = 200000
+EVENTS_PER_TICK = 4
+
+
+def record_ticks(tel, ticks):
+    record = tel.record
+    for i in range(ticks):
+        tel.tick = i
+        record(TICK, 16.0, 40, 3, 2, 20, i, 1)
+        for _ in range(EVENTS_PER_TICK):
+            record(MONSTER_HIT, 0.0, 100, 200, 1)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    tel = Telemetry(True, flush_interval=0.05)
+    tel.start(directory)
+    ticks = CALLS // (EVENTS_PER_TICK + 1)
+    seconds = timed(record_ticks, tel, ticks, repeat=3)
+    tel.stop()
+    per_record_us = seconds / (ticks * (EVENTS_PER_TICK + 1)) * 1e6
+    per_tick_us = seconds / ticks * 1e6
+    budget_us = 1e6 / FPS
+    on_disk = sum(1 for _ in read_records(tel.path))
+    print(f"{per_record_us:.3f} us per record, {per_tick_us:.2f} us per tick "
+          f"({EVENTS_PER_TICK} events), {per_tick_us / budget_us * 100:.4f}% of a {budget_us / 1000:.1f} ms frame")
+    print(f"{tel.written} records written, {on_disk} on disk, {tel.dropped} dropped")
+    off = Telemetry(False)
+    off_us = timed(record_ticks, off, ticks, repeat=3) / ticks * 1e6
+    print(f"disabled: {off_us:.2f} us per tick")
+    os.remove(tel.path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
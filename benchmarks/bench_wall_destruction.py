@@ -0,0 +1,87 @@
+"""
+Cost of breaking maze walls one at a time.
+
+Mazes of growing size are built with the same wall layout as the game.
+Every breakable wall is then broken in random order through MazeWalls, and
+the per-wall cost is compared with rebuilding the wall sprites and the
+WallGrid from the maze, which is what a change cost before. The script
+also checks that the maze flags, the sprite group and the grid agree
+afterwards.
+"""
+import random
+import time
+
+from common import init_headless
+
+init_headless()
+import pygame
+from config import MAZE_CELL_SIZE
+from models.maze import EllerColumns, MazeWalls, cell_walls
+from models.collision import WallGrid
+
+SIZES = (25, 50, 100, 200)
+
+
+def build(cols, rows, seed):
+    """A cols x rows perfect maze (Eller's algorithm, no recursion limit) and its walls."""
+    generator = EllerColumns(rows, random.Random(seed))
+    columns = [generator.next_column() for _ in range(cols)]
+    maze = [[columns[col][row] for col in range(cols)] for row in range(rows)]
+    # The last column must be closed on the right, as in generate_maze
+    for row in range(rows):
+        maze[row][cols - 1]['walls'][1] = True
+    return maze
+
+
+def wall_group_for(maze):
+    rows, cols = len(maze), len(maze[0])
+    walls = pygame.sprite.Group()
+    for row in range(rows):
+        for col in range(cols):
+            walls.add(cell_walls(col, row, maze[row][col], col == cols - 1, row == rows - 1))
+    return walls
+
+
+def check(maze, walls, grid):
+    standing = {wall.edge for wall in walls}
+    in_grid = {id(w) for bucket in grid.cells.values() for w in bucket}
+    if in_grid != {id(w) for w in walls}:
+        return "grid out of date"
+    for (col, row, side) in standing:
+        if not maze[row][col]['walls'][side]:
+            return "flags out of date"
+    for row, cells in enumerate(maze):
+        for col, cell in enumerate(cells):
+            # Top and left edges are drawn by the cell itself
+            for side in (0, 3):
+                if cell['walls'][side] != ((col, row, side) in standing):
+                    return "flags out of date"
+    return "consistent"
+
+
+def main():
+    for size in SIZES:
+        maze = build(size, size, size)
+        walls = wall_group_for(maze)
+        grid = WallGrid(walls, MAZE_CELL_SIZE)
+        maze_walls = MazeWalls(lambda col, row: maze[row][col], grid, size, size)
+
+        start = time.perf_counter()
+        wall_group_for(maze)
+        WallGrid(walls, MAZE_CELL_SIZE)
+        rebuild = time.perf_counter() - start
+
+        targets = [wall for wall in walls if maze_walls.is_breakable(wall)]
+        random.Random(1).shuffle(targets)
+        total = len(walls)
+        start = time.perf_counter()
+        for wall in targets:
+            maze_walls.break_wall(wall)
+        elapsed = time.perf_counter() - start
+        print(f"{size:3d}x{size:<3d} maze: {total:6d} walls, broke {maze_walls.broken:6d} "
+              f"in {elapsed * 1000:7.1f} ms ({elapsed / len(targets) * 1e6:5.1f} us/wall), "
+              f"full rebuild {rebuild * 1000:7.1f} ms; {check(maze, walls, grid)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Shared setup for the benchmark scripts.
+Benchmarks run headless; start them from the repository root, e.g.
+    python benchmarks/bench_projectile_collision.py
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def init_headless():
+    """Start pygame with dummy video/audio drivers and a display surface."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import pygame
+    from config import SCREEN_WIDTH, SCREEN_HEIGHT
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+class Box:
+    """Minimal stand-in for a sprite when only a rect is needed."""
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def maze_wall_boxes(maze, cell_size, thickness):
+    """Wall rects for a maze of any size, with the same layout as generate_maze_walls."""
+    import pygame
+    rows, cols = len(maze), len(maze[0])
+    boxes = []
+    for row in range(rows):
+        for col in range(cols):
+            x, y = col * cell_size, row * cell_size
+            walls = maze[row][col]['walls']
+            if walls[0]:
+                boxes.append(Box(pygame.Rect(x, y, cell_size, thickness)))
+            if walls[1] and col == cols - 1:
+                boxes.append(Box(pygame.Rect(x + cell_size - thickness, y, thickness, cell_size)))
+            if walls[2] and row == rows - 1:
+                boxes.append(Box(pygame.Rect(x, y + cell_size - thickness, cell_size, thickness)))
+            if walls[3]:
+                boxes.append(Box(pygame.Rect(x, y, thickness, cell_size)))
+    return boxes
+
+
+def timed(func, *args, repeat=5):
+    """Best wall-clock time of `repeat` calls, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
@@ -0,0 +1,161 @@
+import atexit
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+import pygame
+from config import (
+    CAPTURE_ENABLED, CAPTURE_QUEUE_FRAMES, CAPTURE_CHUNK_FRAMES,
+    CAPTURE_COMPRESS_LEVEL, CAPTURE_DIR
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# magic, width, height, pitch, bytes per pixel, compressed, R/G/B/A masks
+CHUNK_HEADER = struct.Struct('<4sHHHBB4I')
+# tick, size of the (compressed) pixel data that follows
+FRAME_HEADER = struct.Struct('<II')
+MAGIC = b'DCAP'
+
+
+def frame_view(surface):
+    """
+    Zero-copy view of a surface's RGB pixels, indexed [x][y][channel]: a
+    NumPy array from surfarray.pixels3d when NumPy is installed, otherwise a
+    BufferProxy usable through the buffer protocol. The surface stays locked
+    (and cannot be blitted to) until the view is released.
+    """
+    if numpy is not None:
+        return pygame.surfarray.pixels3d(surface)
+    return surface.get_view('3')
+
+
+class FrameCapture:
+    """
+    Streams rendered frames to disk without stalling the game loop.
+    Each captured frame costs one copy of the screen's pixel buffer into a
+    preallocated slot; a background thread compresses the slot (zlib, so
+    lossless) or writes it raw, then hands it back. When every slot is still
+    waiting for the writer the frame is dropped and counted, never waited for.
+    Frames go to chunk files of CAPTURE_CHUNK_FRAMES frames each.
+    """
+    def __init__(self, enabled, slots=CAPTURE_QUEUE_FRAMES, chunk_frames=CAPTURE_CHUNK_FRAMES,
+                 compress_level=CAPTURE_COMPRESS_LEVEL):
+        self.enabled = enabled
+        self.slots = slots
+        self.chunk_frames = chunk_frames
+        self.compress_level = compress_level
+        self.free = queue.Queue()
+        # Bounded by the number of slots: (tick, slot), or None to stop
+        self.filled = queue.Queue()
+        self.size = None
+        self.header = None
+        self.directory = None
+        self.thread = None
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.bytes_written = 0
+        self.chunks = 0
+
+    def start(self, surface, directory=CAPTURE_DIR):
+        """Allocate the slots for frames of this surface and start the writer thread (once)."""
+        if not self.enabled or self.thread is not None:
+            return
+        self.size = surface.get_pitch() * surface.get_height()
+        for _ in range(self.slots):
+            self.free.put(bytearray(self.size))
+        self.header = CHUNK_HEADER.pack(MAGIC, surface.get_width(), surface.get_height(),
+                                        surface.get_pitch(), surface.get_bytesize(),
+                                        self.compress_level > 0, *surface.get_masks())
+        self.directory = os.path.join(directory, time.strftime("capture-%Y%m%d-%H%M%S"))
+        os.makedirs(self.directory, exist_ok=True)
+        self.thread = threading.Thread(target=self._write_loop, name="capture", daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Write out the frames still queued and close the last chunk."""
+        if self.thread is None:
+            return
+        self.filled.put(None)
+        self.thread.join()
+        self.thread = None
+        logging.getLogger(__name__).info(self.report())
+
+    def frame(self, surface, tick):
+        """Queue the surface's current pixels; call right after drawing or flipping it."""
+        if self.thread is None:
+            return
+        try:
+            slot = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        pixels = surface.get_buffer()
+        memoryview(slot)[:] = pixels
+        # Unlock the surface before anything else draws on it
+        del pixels
+        self.captured += 1
+        self.filled.put((tick, slot))
+
+    def _write_loop(self):
+        file = None
+        in_chunk = 0
+        while True:
+            item = self.filled.get()
+            if item is None:
+                break
+            tick, slot = item
+            data = zlib.compress(slot, self.compress_level) if self.compress_level > 0 else slot
+            if file is None:
+                file = open(os.path.join(self.directory, "chunk-%05d.bin" % self.chunks), 'wb')
+                file.write(self.header)
+                self.chunks += 1
+            file.write(FRAME_HEADER.pack(tick, len(data)))
+            file.write(data)
+            # Raw data is the slot itself, so only recycle it once written
+            self.free.put(slot)
+            self.written += 1
+            self.bytes_written += FRAME_HEADER.size + len(data)
+            in_chunk += 1
+            if in_chunk == self.chunk_frames:
+                file.close()
+                file = None
+                in_chunk = 0
+        if file is not None:
+            file.close()
+
+    def report(self):
+        return ("capture: %d frames captured, %d written in %d chunks (%.1f MB), %d dropped"
+                % (self.captured, self.written, self.chunks, self.bytes_written / 1e6, self.dropped))
+
+
+def read_chunk(path):
+    """Yield (tick, Surface) for every frame in a capture chunk file."""
+    with open(path, 'rb') as f:
+        magic, width, height, pitch, bytesize, compressed, *masks = CHUNK_HEADER.unpack(
+            f.read(CHUNK_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("%s is not a capture chunk" % path)
+        while True:
+            header = f.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                return
+            tick, length = FRAME_HEADER.unpack(header)
+            data = f.read(length)
+            if compressed:
+                data = zlib.decompress(data)
+            # Rows are pitch bytes long, which may include padding past the last pixel
+            surface = pygame.Surface((pitch // bytesize, height), 0, bytesize * 8, masks)
+            surface.get_buffer().write(data)
+            yield tick, surface.subsurface((0, 0, width, height))
+
+
+capture = FrameCapture(CAPTURE_ENABLED)
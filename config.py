@@ -33,6 +33,24 @@ WALL_THICKNESS = 12
 WORLD_WIDTH = MAZE_COLS * MAZE_CELL_SIZE
 WORLD_HEIGHT = MAZE_ROWS * MAZE_CELL_SIZE
 
+# Endless mode: maze columns stream in ahead of the camera and are dropped behind it
+ENDLESS_MODE = False
+ENDLESS_SEED = None
+ENDLESS_COLUMNS_AHEAD = 3
+ENDLESS_COLUMNS_BEHIND = 3
+# Rect coordinates are 32-bit, so the endless world is capped at this width
+ENDLESS_WORLD_WIDTH = 2 ** 30
+
+# Background parameters
+# The tiled background is generated lazily in square chunks of
+# BACKGROUND_CHUNK_TILES x BACKGROUND_CHUNK_TILES tiles.
+BACKGROUND_TILE_SIZE = (128, 100)
+BACKGROUND_CHUNK_TILES = 4
+# Memory cap for cached chunks (should fit at least one screen of chunks)
+BACKGROUND_CACHE_BYTES = 16 * 1024 * 1024
+# Seed for tile selection; None picks a new layout every game
+BACKGROUND_SEED = None
+
 # Player parameters
 PLAYER_SPEED = 3
 PLAYER_LIVES = 20
@@ -41,6 +59,8 @@ PLAYER_SIZE = 40
 KNOCKBACK_DISTANCE = 40
 KNOCKBACK_SPEED = 2
 KNOCKBACK_DURATION = int(KNOCKBACK_DISTANCE / KNOCKBACK_SPEED)
+# Check player/monster contact on sprite masks instead of bounding rects
+PIXEL_PERFECT_HITS = True
 
 # Attack parameters
 FIST_SPEED = 5
@@ -48,6 +68,47 @@ FIST_LIFETIME = 8
 FIST_WIDTH = 20
 FIST_LENGTH = 30
 FIST_THROUGH_WALLS = True
+ARROW_SPEED = FIST_SPEED * 2.5
+# Arrows and powered-up fists break the inner maze walls they hit
+DESTRUCTIBLE_WALLS = False
+
+# Pipelined mode: simulate the next tick on a worker thread while drawing the last one
+PIPELINED_MODE = False
+PIPELINE_REPORT_INTERVAL = 10 * FPS   # Frames between overlap reports in the log (0 disables)
+
+# Input-to-display latency measurement (see controllers/input_latency.py)
+INPUT_LATENCY_TRACKING = False
+INPUT_LATENCY_REPORT_INTERVAL = 10 * FPS   # Frames between latency reports in the log (0 disables)
+# Low-latency loop: wait out the frame slack before polling input instead of after the flip
+LOW_LATENCY_MODE = False
+LOW_LATENCY_VSYNC = False      # Present on vsync (needs a SCALED window); the flip then paces the loop
+LOW_LATENCY_MARGIN_MS = 2.0    # Margin kept between the expected end of a frame's work and its deadline
+
+# Surface memory accounting (see surface_tracker.py)
+SURFACE_TRACKING = False
+SURFACE_TRACKING_REPORT_AT_EXIT = True   # F9 logs a report during the game
+
+# Gameplay telemetry (see telemetry.py)
+TELEMETRY_ENABLED = False
+TELEMETRY_CAPACITY = 1 << 16      # Records held in the ring buffer
+TELEMETRY_FLUSH_INTERVAL = 1.0    # Seconds between background flushes
+TELEMETRY_DIR = "telemetry"
+
+# Frame capture to disk (see capture.py)
+CAPTURE_ENABLED = False
+CAPTURE_QUEUE_FRAMES = 8        # Frames waiting for the writer before new ones are dropped
+CAPTURE_CHUNK_FRAMES = 600      # Frames per chunk file
+CAPTURE_COMPRESS_LEVEL = 1      # zlib level (lossless); 0 writes raw pixels
+CAPTURE_DIR = "captures"
+
+# Frame budget governor
+GOVERNOR_ENABLED = True
+GOVERNOR_BUDGET_MS = 1000 / FPS
+GOVERNOR_WINDOW = 30           # Frames averaged before each decision
+GOVERNOR_RESTORE_RATIO = 0.6   # Step back up below budget * ratio
+GOVERNOR_HUD_INTERVAL = 10     # Frames between HUD redraws when throttled
+GOVERNOR_SPAWN_SCALE = 3       # Monster spawn interval multiplier when throttled
+GOVERNOR_FAR_MARGIN = MAZE_CELL_SIZE  # Sprites this far outside the screen count as far away
 
 # Monster parameters
 MONSTER_SPEED = 1
@@ -57,6 +118,22 @@ MONSTER_SPAWN_INTERVAL = 180
 MONSTER_WALK_FRAMES = 8
 MONSTER_ANIM_SPEED = 0.1
 
+# Monster separation and swarming (see models/swarm.py)
+SWARM_ENABLED = True
+SWARM_RADIUS = 2 * MONSTER_SIZE       # Neighbours within this distance affect a monster
+SEPARATION_RADIUS = MONSTER_SIZE      # Neighbours closer than this push it away
+SWARM_MAX_NEIGHBOURS = 8              # Cap on neighbours within the radius per monster per tick
+SWARM_MAX_CHECKS = 32                 # Cap on distance checks per monster per tick
+SEPARATION_WEIGHT = 0.5
+COHESION_WEIGHT = 0.002               # Pull towards the neighbours' centre
+ALIGNMENT_WEIGHT = 0.05               # Turn towards the neighbours' heading
+
+# Monster simulation level of detail
+LOD_ENABLED = True
+LOD_MARGIN = 2 * MAZE_CELL_SIZE   # Monsters this far outside the screen are simulated coarsely
+LOD_TICK_INTERVAL = 4             # Coarse monsters are updated once every N ticks
+LOD_REPORT_INTERVAL = 10 * FPS    # Ticks between tier reports in the log (0 disables)
+
 # Knockback for monsters
 MONSTER_KNOCKBACK_IMAGE_PATH = "assets/monster-knockback.png"
 MONSTER_KNOCKBACK_DURATION = 15
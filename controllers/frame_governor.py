@@ -0,0 +1,72 @@
+import logging
+from collections import deque
+from config import (
+    GOVERNOR_BUDGET_MS, GOVERNOR_WINDOW, GOVERNOR_RESTORE_RATIO,
+    GOVERNOR_HUD_INTERVAL, GOVERNOR_SPAWN_SCALE
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FrameGovernor:
+    """
+    Keeps frame time within a budget by switching optional work off.
+    Update and render times are averaged over a window of frames. When the
+    average goes over budget the governor steps down one level; when it drops
+    below budget * restore_ratio it steps back up. LEVELS[i] names the work
+    that is switched off from level i upwards.
+    """
+    LEVELS = ('full', 'far_animation', 'hud_rate', 'background', 'spawn_rate')
+
+    def __init__(self, budget_ms=GOVERNOR_BUDGET_MS, window=GOVERNOR_WINDOW,
+                 restore_ratio=GOVERNOR_RESTORE_RATIO):
+        self.budget_ms = budget_ms
+        self.restore_ratio = restore_ratio
+        self.level = 0
+        self.frame = 0
+        self.update_samples = deque(maxlen=window)
+        self.render_samples = deque(maxlen=window)
+        # (frame, old level, new level, average frame ms) for every change
+        self.decisions = []
+
+    @property
+    def animate_far_sprites(self):
+        return self.level < 1
+
+    @property
+    def hud_interval(self):
+        return 1 if self.level < 2 else GOVERNOR_HUD_INTERVAL
+
+    @property
+    def background_detail(self):
+        return self.level < 3
+
+    @property
+    def spawn_interval_scale(self):
+        return 1 if self.level < 4 else GOVERNOR_SPAWN_SCALE
+
+    def record(self, update_ms, render_ms):
+        """Add one frame's timings; returns True if the level changed."""
+        self.frame += 1
+        self.update_samples.append(update_ms)
+        self.render_samples.append(render_ms)
+        if len(self.update_samples) < self.update_samples.maxlen:
+            return False
+        avg_update = sum(self.update_samples) / len(self.update_samples)
+        avg_render = sum(self.render_samples) / len(self.render_samples)
+        avg = avg_update + avg_render
+        if avg > self.budget_ms and self.level < len(self.LEVELS) - 1:
+            new_level = self.level + 1
+        elif avg < self.budget_ms * self.restore_ratio and self.level > 0:
+            new_level = self.level - 1
+        else:
+            return False
+        logger.info("frame %d: level %d -> %d (%s), avg %.2f ms (update %.2f, render %.2f), budget %.2f ms",
+                    self.frame, self.level, new_level, self.LEVELS[new_level],
+                    avg, avg_update, avg_render, self.budget_ms)
+        self.decisions.append((self.frame, self.level, new_level, avg))
+        self.level = new_level
+        # Measure the new level on fresh samples before deciding again
+        self.update_samples.clear()
+        self.render_samples.clear()
+        return True
@@ -1,4 +1,4 @@
-import sys, math, random, pygame
+import sys, math, random, time, logging, pygame
 from config import (
     FPS, SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_SPEED,
     MONSTER_SPAWN_INTERVAL, POWERUP_SPAWN_INTERVAL,
@@ -6,23 +6,59 @@ from config import (
     NO_KEY_IMAGE_PATH, KEY_IMAGE_PATH, POWERUP_ICON_IMAGE_PATH,
     COLOR_BG, WORLD_WIDTH, WORLD_HEIGHT, KNOCKBACK_DURATION,
     KNOCKBACK_SPEED, INVULN_TIME, NUM_MONSTERS_INIT, KEY_DROP_PROBABILITY,
-    MAZE_CELL_SIZE, MAZE_COLS, MAZE_ROWS, PLAYER_SIZE
+    MAZE_CELL_SIZE, MAZE_COLS, MAZE_ROWS, PLAYER_SIZE,
+    GOVERNOR_ENABLED, GOVERNOR_FAR_MARGIN, LOD_ENABLED, PIPELINED_MODE,
+    ENDLESS_MODE, ENDLESS_SEED, ENDLESS_WORLD_WIDTH, PIXEL_PERFECT_HITS, SWARM_ENABLED,
+    INPUT_LATENCY_REPORT_INTERVAL, LOW_LATENCY_MODE, LOW_LATENCY_VSYNC,
+    DESTRUCTIBLE_WALLS
 )
 from models.player import Player
 from models.monster import Monster
 from models.item import Key, Endpoint, AttackRangePowerUp, Bow
 from models.weapon import Fist, Arrow
-from models.maze import generate_maze, generate_maze_walls
+from models.maze import generate_maze, generate_maze_walls, MazeWalls
+from models.collision import WallGrid, first_hit, harmful_contact
+from models.endless import DungeonStream
+from models.swarm import Swarm
 from views.renderer import Renderer
+from controllers.frame_governor import FrameGovernor
+from controllers.monster_lod import MonsterLOD
+from controllers.pipeline import SimulationPipeline
+from controllers.input_latency import LatePollPacer
 from helper import load_image
+from surface_tracker import tracker
+from capture import capture
+from telemetry import (
+    telemetry, TICK, MONSTER_SPAWN, MONSTER_KILL, MONSTER_DESPAWN,
+    KEY_SPAWN, KEY_PICKUP, POWERUP_SPAWN, POWERUP_PICKUP
+)
 
 class GameController:
-    def __init__(self, screen):
+    def __init__(self, screen, latency=None):
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.maze = generate_maze(MAZE_COLS, MAZE_ROWS)
-        self.wall_group = generate_maze_walls(self.maze)
-        self.background_image = load_image(BACKGROUND_IMAGE_PATH, (WORLD_WIDTH, WORLD_HEIGHT)) if BACKGROUND_IMAGE_PATH else None
+        if ENDLESS_MODE:
+            # The maze streams in column by column as the camera moves right
+            self.stream = DungeonStream(MAZE_ROWS, ENDLESS_SEED)
+            self.stream.advance(0)
+            self.maze = None
+            self.wall_group = self.stream.wall_group
+            self.wall_grid = self.stream.wall_grid
+            world_size = (ENDLESS_WORLD_WIDTH, WORLD_HEIGHT)
+        else:
+            self.stream = None
+            self.maze = generate_maze(MAZE_COLS, MAZE_ROWS)
+            self.wall_group = generate_maze_walls(self.maze)
+            self.wall_grid = WallGrid(self.wall_group, MAZE_CELL_SIZE)
+            world_size = (WORLD_WIDTH, WORLD_HEIGHT)
+        if DESTRUCTIBLE_WALLS:
+            if self.stream:
+                self.maze_walls = MazeWalls(self.stream.cell, self.wall_grid, MAZE_ROWS)
+            else:
+                self.maze_walls = MazeWalls(lambda col, row: self.maze[row][col], self.wall_grid,
+                                            MAZE_ROWS, MAZE_COLS)
+        else:
+            self.maze_walls = None
         self.heart_image = load_image(HEART_IMAGE_PATH, (25,25)) if HEART_IMAGE_PATH else None
         self.no_key_icon = load_image(NO_KEY_IMAGE_PATH, (25,35)) if NO_KEY_IMAGE_PATH else None
         self.key_icon = load_image(KEY_IMAGE_PATH, (25,35)) if KEY_IMAGE_PATH else None
@@ -37,24 +73,21 @@ class GameController:
         self.projectile_group = pygame.sprite.Group()
 
         self.player = Player((MAZE_CELL_SIZE//2, MAZE_CELL_SIZE//2))
+        self.player.bounds.size = world_size
         self.all_sprites.add(self.player)
 
         for _ in range(NUM_MONSTERS_INIT):
-            while True:
-                col = random.randint(0, MAZE_COLS-1)
-                row = random.randint(0, MAZE_ROWS-1)
-                if (col, row) not in [(0,0), (MAZE_COLS-1, MAZE_ROWS//2)]:
-                    break
+            col, row = self.random_cell()
             pos = (col*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2, row*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2)
             monster = Monster(pos)
+            telemetry.record(MONSTER_SPAWN, 0.0, *pos)
             self.all_sprites.add(monster)
             self.monster_group.add(monster)
 
         # Spawn Bow powerup ensuring it doesn't overlap walls
         bow_spawned = False
         while not bow_spawned:
-            col = random.randint(0, MAZE_COLS-1)
-            row = random.randint(0, MAZE_ROWS-1)
+            col, row = self.random_cell(avoid_special=False)
             pos = (col*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2, row*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2)
             if not any(w.rect.collidepoint(pos) for w in self.wall_group):
                 bow = Bow(pos)
@@ -62,9 +95,11 @@ class GameController:
                 self.powerup_group.add(bow)
                 bow_spawned = True
 
-        endpoint = Endpoint((MAZE_COLS-1, MAZE_ROWS//2))
-        self.all_sprites.add(endpoint)
-        self.endpoint_group.add(endpoint)
+        # The endless mode has no treasure to reach
+        if not self.stream:
+            endpoint = Endpoint((MAZE_COLS-1, MAZE_ROWS//2))
+            self.all_sprites.add(endpoint)
+            self.endpoint_group.add(endpoint)
 
         self.monster_spawn_timer = 0
         self.powerup_spawn_timer = 0
@@ -73,35 +108,135 @@ class GameController:
         self.endpoint_message = None
         self.camera_x = 0
 
+        # Sprite groups drawn by the renderer, by layer (see Renderer.LAYERS)
+        self.render_layers = {
+            'walls': [self.wall_group],
+            'items': [self.endpoint_group, self.key_group, self.powerup_group],
+            'monsters': [self.monster_group],
+            'projectiles': [self.fist_group, self.projectile_group],
+            'player': [[self.player]],
+        }
+
         self.renderer = Renderer(self.screen, {
-            'background': self.background_image,
+            # Path only: the renderer loads it if no tiles are available
+            'background': BACKGROUND_IMAGE_PATH,
             'heart': self.heart_image,
             'no_key': self.no_key_icon,
             'key': self.key_icon,
             'powerup': self.powerup_icon,
             'bg_color': COLOR_BG
-        })
+        }, world_size)
+
+        self.governor = FrameGovernor() if GOVERNOR_ENABLED else None
+        self.monster_lod = MonsterLOD() if LOD_ENABLED else None
+        self.swarm = Swarm() if SWARM_ENABLED else None
+        self.frame_ms = 0.0
+        # Ticks simulated so far; the latency tracker matches frames to ticks by it
+        self.tick = 0
+        self.flip_started = 0.0
+        # InputLatency or None; passed in so it outlives restarts and covers the whole session
+        self.latency = latency
+        # Keyboard state sampled with the events of the current frame
+        self.keys = None
+        telemetry.start()
+        capture.start(self.screen)
 
         self.font = pygame.font.Font("fonts/GrechenFuemen-Regular.ttf", 28)
         self.title_font = pygame.font.Font("fonts/GrechenFuemen-Regular.ttf", 48)
 
-    def run(self):
+    def random_cell(self, avoid_special=True):
+        """
+        Pick a random maze cell, by default avoiding the start and endpoint
+        cells; the endless dungeon has no endpoint, so there it avoids the
+        player's current cell instead.
+        """
+        if self.stream:
+            min_col, max_col = self.stream.first_col, self.stream.next_col - 1
+            px, py = self.player.rect.center
+            special = [(px // MAZE_CELL_SIZE, py // MAZE_CELL_SIZE)]
+        else:
+            min_col, max_col = 0, MAZE_COLS - 1
+            special = [(0,0), (MAZE_COLS-1, MAZE_ROWS//2)]
         while True:
-            self.handle_events()
-            self.update()
-            self.renderer.render(self.all_sprites, self.wall_group, self.player, self.endpoint_group,
-                                 self.camera_x, self.game_over, self.win, self.endpoint_message,
-                                 self.font, self.title_font)
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            col = random.randint(min_col, max_col)
+            row = random.randint(0, MAZE_ROWS - 1)
+            if not avoid_special or (col, row) not in special:
+                return col, row
+
+    def evict_behind(self, left):
+        """Remove entities that are not fully inside the part of the endless dungeon still kept."""
+        for group in (self.monster_group, self.key_group, self.powerup_group,
+                      self.projectile_group, self.fist_group):
+            for sprite in group:
+                if sprite.rect.left < left:
+                    if group is self.monster_group:
+                        telemetry.record(MONSTER_DESPAWN, 0.0, *sprite.rect.center)
+                    sprite.kill()
+
+    def run(self):
+        step = SimulationPipeline(self).step if PIPELINED_MODE else self.step
+        if LOW_LATENCY_MODE:
+            # Sleep before polling input rather than after the flip
+            pacer = LatePollPacer(vsync=LOW_LATENCY_VSYNC)
+            while True:
+                pacer.wait()
+                start = time.perf_counter()
+                step()
+                pacer.frame_done(max(0.0, self.flip_started - start))
+        else:
+            while True:
+                step()
+                self.clock.tick(FPS)
+
+    def step(self):
+        """One frame: events, simulation, then drawing, all on this thread."""
+        start = time.perf_counter()
+        self.handle_events()
+        self.update()
+        updated = time.perf_counter()
+        self.renderer.render(self.render_layers, self.player, self.camera_x, self.game_over,
+                             self.win, self.endpoint_message, self.font, self.title_font)
+        self.flip()
+        rendered = time.perf_counter()
+        self.record_frame(updated - start, rendered - updated)
+
+    def flip(self, tick=None):
+        """Present the drawn frame, which shows the state after `tick` (default: the last one)."""
+        self.flip_started = time.perf_counter()
+        pygame.display.flip()
+        capture.frame(self.screen, self.tick if tick is None else tick)
+        if self.latency:
+            self.latency.flipped(self.tick if tick is None else tick)
+            if INPUT_LATENCY_REPORT_INTERVAL and self.tick % INPUT_LATENCY_REPORT_INTERVAL == 0:
+                logging.getLogger(__name__).info(self.latency.report())
+
+    def simulate(self):
+        """Run one tick and capture the Frame to draw for it."""
+        self.update()
+        return self.renderer.snapshot(self.render_layers, self.player, self.camera_x,
+                                      self.game_over, self.win, self.endpoint_message)
+
+    def record_frame(self, update_seconds, render_seconds):
+        """Note the frame time and let the governor adjust the detail settings."""
+        self.frame_ms = (update_seconds + render_seconds) * 1000
+        if self.governor and self.governor.record(update_seconds * 1000, render_seconds * 1000):
+            self.renderer.hud_interval = self.governor.hud_interval
+            self.renderer.background_detail = self.governor.background_detail
 
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.latency:
+            self.latency.poll(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F9 and tracker.enabled:
+                    logging.getLogger(__name__).info("Surface memory:\n%s", tracker.report())
                 if event.key == pygame.K_r and (self.game_over or self.win):
-                    self.__init__(self.screen)
+                    if self.latency:
+                        self.latency.restart()
+                    self.__init__(self.screen, self.latency)
                 if event.key == pygame.K_SPACE and not (self.game_over or self.win):
                     if self.player.has_bow and not self.player.is_attacking:
                         self.player.start_arrow_attack()
@@ -109,32 +244,52 @@ class GameController:
                         fist = Fist(self.player, self.wall_group)
                         self.all_sprites.add(fist)
                         self.fist_group.add(fist)
+        self.keys = pygame.key.get_pressed()
 
     def update(self):
+        moved_from = self.player.rect.topleft
         if not (self.game_over or self.win):
-            self.player.update(self.wall_group)
-            for monster in self.monster_group:
-                monster.update(self.wall_group)
+            self.player.update(self.wall_group, self.keys)
+            # Under load the governor stops animating monsters far outside the screen
+            view = None
+            if self.governor and not self.governor.animate_far_sprites:
+                view = pygame.Rect(self.camera_x - GOVERNOR_FAR_MARGIN, 0,
+                                   SCREEN_WIDTH + 2 * GOVERNOR_FAR_MARGIN, SCREEN_HEIGHT)
+            if self.monster_lod:
+                self.monster_lod.update(self.monster_group, self.wall_group, self.wall_grid,
+                                        self.camera_x, view, self.swarm)
+            else:
+                if self.swarm:
+                    self.swarm.steer(self.monster_group)
+                for monster in self.monster_group:
+                    monster.update(self.wall_group, view is None or view.colliderect(monster.rect))
             for projectile in self.projectile_group:
+                # Walls are checked by the projectile itself with a swept test
                 projectile.update()
-                # Check collision with walls
-                for wall in self.wall_group:
-                    if projectile.rect.colliderect(wall.rect):
-                        projectile.kill()
-                        break
-                # Check collision with monsters (process only one collision)
-                for m in pygame.sprite.spritecollide(projectile, self.monster_group, False):
+                # Check collision with monsters along the same move, stopping at
+                # the wall if one was hit (process only one collision)
+                dx, dy = projectile.move
+                max_t = 1.0 if projectile.wall_hit_t is None else projectile.wall_hit_t
+                _, m = first_hit(projectile.prev_rect, dx, dy, self.monster_group, max_t)
+                if self.maze_walls and projectile.wall_hit is not None and not m:
+                    self.maze_walls.break_wall(projectile.wall_hit)
+                if m:
                     m.hit(projectile.direction * KNOCKBACK_SPEED)
                     projectile.kill()
                     if m.is_dying and not hasattr(m, 'key_dropped'):
                         m.key_dropped = True
                         if random.random() < KEY_DROP_PROBABILITY and not self.player.has_key:
                             key = Key(m.rect.centerx, m.rect.centery)
+                            telemetry.record(KEY_SPAWN, 0.0, *key.rect.center)
                             self.all_sprites.add(key)
                             self.key_group.add(key)
-                    break
             for fist in self.fist_group:
                 fist.update()
+                if self.maze_walls and fist.powered and fist.alive():
+                    for wall in self.wall_grid.walls_near(fist.rect):
+                        if fist.rect.colliderect(wall.rect) and self.maze_walls.break_wall(wall):
+                            fist.kill()
+                            break
                 collided = pygame.sprite.spritecollide(fist, self.monster_group, False)
                 for m in collided:
                     knockback_velocity = self.player.direction * KNOCKBACK_SPEED
@@ -144,17 +299,14 @@ class GameController:
                         m.key_dropped = True
                         if random.random() < KEY_DROP_PROBABILITY and not self.player.has_key:
                             key = Key(m.rect.centerx, m.rect.centery)
+                            telemetry.record(KEY_SPAWN, 0.0, *key.rect.center)
                             self.all_sprites.add(key)
                             self.key_group.add(key)
                     break
 
-            collided_monsters = pygame.sprite.spritecollide(self.player, self.monster_group, False)
-            for m in collided_monsters:
-                if m.is_dying:
-                    continue
-                # If the player is currently invulnerable, skip damage processing
-                if self.player.invuln_timer > 0:
-                    continue
+            # Rects find the candidates; cached masks decide pixel-accurate contact
+            m = harmful_contact(self.player, self.monster_group, PIXEL_PERFECT_HITS)
+            if m:
                 if self.player.is_attacking:
                     self.player.is_attacking = False
                     self.player.attack_anim_index = 0
@@ -174,6 +326,7 @@ class GameController:
                     m.key_dropped = True
                     if random.random() < KEY_DROP_PROBABILITY and not self.player.has_key:
                         key = Key(m.rect.centerx, m.rect.centery)
+                        telemetry.record(KEY_SPAWN, 0.0, *key.rect.center)
                         self.all_sprites.add(key)
                         self.key_group.add(key)
                 if self.player.lives <= 0:
@@ -190,11 +343,13 @@ class GameController:
 
             key_hit = pygame.sprite.spritecollideany(self.player, self.key_group)
             if key_hit:
+                telemetry.record(KEY_PICKUP, 0.0, *key_hit.rect.center)
                 self.player.has_key = True
                 key_hit.kill()
 
             powerup_hit = pygame.sprite.spritecollideany(self.player, self.powerup_group)
             if powerup_hit:
+                telemetry.record(POWERUP_PICKUP, 0.0, *powerup_hit.rect.center)
                 powerup_hit.apply(self.player)
                 powerup_hit.kill()
 
@@ -204,42 +359,60 @@ class GameController:
                     if self.player.attack_anim_index >= 7 and not self.player.arrow_spawned:
                         for offset in [-5, 0, 5]:
                             direction = self.player.direction.rotate(offset)
-                            arrow = Arrow(self.player.rect.center, direction, self.wall_group)
+                            arrow = Arrow(self.player.rect.center, direction, self.wall_grid)
                             self.all_sprites.add(arrow)
                             self.projectile_group.add(arrow)
                         self.player.arrow_spawned = True
                 else:
                     if self.player.attack_anim_index >= 7 and not self.player.arrow_spawned:
-                        arrow = Arrow(self.player.rect.center, self.player.direction, self.wall_group)
+                        arrow = Arrow(self.player.rect.center, self.player.direction, self.wall_grid)
                         self.all_sprites.add(arrow)
                         self.projectile_group.add(arrow)
                         self.player.arrow_spawned = True
 
             self.camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-            self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH - SCREEN_WIDTH))
+            if self.stream:
+                # No right edge; the left edge follows the columns still kept
+                self.camera_x = max(self.stream.left, self.camera_x)
+                if self.stream.advance(self.camera_x):
+                    self.evict_behind(self.stream.left)
+                    self.player.bounds.left = self.stream.left
+            else:
+                self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH - SCREEN_WIDTH))
 
             self.monster_spawn_timer += 1
-            if self.monster_spawn_timer >= MONSTER_SPAWN_INTERVAL:
+            spawn_interval = MONSTER_SPAWN_INTERVAL
+            if self.governor:
+                spawn_interval *= self.governor.spawn_interval_scale
+            if self.monster_spawn_timer >= spawn_interval:
                 self.monster_spawn_timer = 0
-                while True:
-                    col = random.randint(0, MAZE_COLS - 1)
-                    row = random.randint(0, MAZE_ROWS - 1)
-                    if (col, row) not in [(0,0), (MAZE_COLS-1, MAZE_ROWS//2)]:
-                        break
+                col, row = self.random_cell()
                 pos = (col*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2, row*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2)
                 new_monster = Monster(pos)
+                telemetry.record(MONSTER_SPAWN, 0.0, *pos)
                 self.all_sprites.add(new_monster)
                 self.monster_group.add(new_monster)
 
             self.powerup_spawn_timer += 1
             if self.powerup_spawn_timer >= POWERUP_SPAWN_INTERVAL:
                 self.powerup_spawn_timer = 0
-                while True:
-                    col = random.randint(0, MAZE_COLS - 1)
-                    row = random.randint(0, MAZE_ROWS - 1)
-                    if (col, row) not in [(0,0), (MAZE_COLS-1, MAZE_ROWS//2)]:
-                        break
+                col, row = self.random_cell()
                 pos = (col*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2, row*MAZE_CELL_SIZE+MAZE_CELL_SIZE//2)
                 powerup = AttackRangePowerUp(pos)
+                telemetry.record(POWERUP_SPAWN, 0.0, *pos)
                 self.all_sprites.add(powerup)
                 self.powerup_group.add(powerup)
+
+        self.tick += 1
+        if self.latency:
+            # What a key press can visibly change about the player
+            self.latency.tick_done(self.tick, (self.player.rect.topleft != moved_from,
+                                               tuple(self.player.direction),
+                                               self.player.is_attacking, tuple(self.fist_group)))
+
+        # One fixed-size telemetry record per tick
+        telemetry.tick += 1
+        telemetry.record(TICK, self.frame_ms, len(self.monster_group),
+                         len(self.projectile_group) + len(self.fist_group),
+                         len(self.key_group) + len(self.powerup_group), self.player.lives,
+                         telemetry.counts[MONSTER_KILL], telemetry.counts[KEY_PICKUP])
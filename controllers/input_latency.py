@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+import pygame
+from config import FPS, LOW_LATENCY_MARGIN_MS
+
+logger = logging.getLogger(__name__)
+
+# Keys whose effect on the player we time
+TRACKED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE)
+
+
+class InputLatency:
+    """
+    Measures input-to-display latency.
+    A key press is stamped when the controller takes it off the event queue,
+    or with its `time` attribute (a time.perf_counter() value) if it has one,
+    as scripted input can set.
+    It takes effect in the first tick after which the player's visible state
+    (heading, moving or not, attacking, fists in flight) differs from what it
+    was when the key was read, and it is on screen once the Frame of that tick
+    has been flipped. pygame does not expose when the OS saw a key, so for
+    real input the numbers leave out the time a press waited to be read.
+    Ticks and flips may happen on different threads (see SimulationPipeline).
+    """
+    # Presses with no visible effect for this long (e.g. on the game over screen) are dropped
+    TIMEOUT = 1.0
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = None
+        # (pressed at, player state when pressed), waiting for a tick to show an effect
+        self.pending = []
+        # (pressed at, tick), waiting for that tick's frame to be flipped
+        self.applied = []
+        self.latencies = []
+        self.no_effect = 0
+
+    def restart(self):
+        """Drop presses still in flight; call when the game restarts and ticks count from 0 again."""
+        with self.lock:
+            self.state = None
+            self.pending = []
+            self.applied = []
+
+    def poll(self, events):
+        """Stamp the tracked key presses in a batch of events."""
+        now = time.perf_counter()
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in TRACKED_KEYS:
+                self.pending.append((getattr(event, 'time', now), self.state))
+
+    def tick_done(self, tick, state):
+        """Note the player state after a tick; presses it changed take effect in this tick."""
+        self.state = state
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        waiting = []
+        with self.lock:
+            for pressed, before in self.pending:
+                if state != before:
+                    self.applied.append((pressed, tick))
+                elif now - pressed > self.TIMEOUT:
+                    self.no_effect += 1
+                else:
+                    waiting.append((pressed, before))
+        self.pending = waiting
+
+    def flipped(self, tick):
+        """Call right after the flip that presented the Frame of `tick`."""
+        now = time.perf_counter()
+        with self.lock:
+            shown = [pressed for pressed, t in self.applied if t <= tick]
+            if shown:
+                self.applied = [(pressed, t) for pressed, t in self.applied if t > tick]
+        self.latencies.extend(now - pressed for pressed in shown)
+
+    def report(self):
+        if not self.latencies:
+            return "input latency: no samples (%d presses without effect)" % self.no_effect
+        ms = sorted(x * 1000 for x in self.latencies)
+        pick = lambda p: ms[min(len(ms) - 1, int(p / 100 * len(ms)))]
+        return ("input latency over %d presses: p50 %.1f ms, p90 %.1f ms, p99 %.1f ms, max %.1f ms "
+                "(%.2f frames at p50; %d presses without effect)"
+                % (len(ms), pick(50), pick(90), pick(99), ms[-1], pick(50) * FPS / 1000, self.no_effect))
+
+
+class LatePollPacer:
+    """
+    Frame pacing for the low-latency loop.
+    The usual loop polls input, simulates, draws, flips and then sleeps in
+    Clock.tick, so a key pressed during that sleep waits for the next frame.
+    This pacer spends the slack *before* polling instead: it waits until the
+    estimated work of the frame (plus a margin) would just finish at the
+    frame deadline, so input is read as late as possible. The last
+    millisecond is busy-waited, as in Clock.tick_busy_loop. With vsync the
+    flip itself blocks until the vertical blank, which then sets the deadline.
+    """
+    def __init__(self, fps=FPS, margin_ms=LOW_LATENCY_MARGIN_MS, vsync=False):
+        self.period = 1.0 / fps
+        self.margin = margin_ms / 1000
+        self.vsync = vsync
+        # High estimate of one frame's work up to the flip, in seconds
+        self.work = self.period / 2
+        self.deadline = None
+        self.frame_start = None
+
+    def wait(self):
+        """Sleep until it is time to poll input for the next frame."""
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now + self.period
+        target = self.deadline - self.work - self.margin
+        if target - now > 0.002:
+            time.sleep(target - now - 0.001)
+        while time.perf_counter() < target:
+            pass
+        self.frame_start = time.perf_counter()
+
+    def frame_done(self, work_seconds):
+        """Call after the flip, with the time the frame took up to the flip."""
+        now = time.perf_counter()
+        # Follow increases at once and decrease slowly, so a spike does not miss the next deadline
+        self.work = min(self.period, max(work_seconds, self.work * 0.95 + work_seconds * 0.05))
+        if self.vsync:
+            self.deadline = now + self.period
+        else:
+            self.deadline += self.period
+            if now > self.deadline:
+                # Missed the deadline: start over from now rather than rushing to catch up
+                self.deadline = now + self.period
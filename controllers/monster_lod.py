@@ -0,0 +1,86 @@
+import logging
+import time
+import pygame
+from config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, LOD_MARGIN, LOD_TICK_INTERVAL, LOD_REPORT_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MonsterLOD:
+    """
+    Splits monsters into simulation tiers by distance from the camera.
+    Monsters inside the screen plus LOD_MARGIN get the full Monster.update
+    every tick. Monsters further away are updated with Monster.update_coarse
+    once every LOD_TICK_INTERVAL ticks, catching up on the ticks they missed.
+    Phases are staggered so the coarse work is spread over the interval.
+    """
+    TIERS = ('full', 'coarse')
+
+    def __init__(self, interval=LOD_TICK_INTERVAL, margin=LOD_MARGIN):
+        self.interval = interval
+        self.margin = margin
+        self.tick = 0
+        self.next_phase = 0
+        self.counts = [0, 0]
+        # Totals since the start of the game
+        self.monster_ticks = [0, 0]
+        self.seconds = [0.0, 0.0]
+
+    def update(self, monsters, walls, wall_grid, camera_x, animate_view=None, swarm=None):
+        """
+        Update every monster for one tick.
+        animate_view, if given, limits walk animation of fully simulated
+        monsters to those overlapping it (see FrameGovernor).
+        swarm, if given, steers the fully simulated monsters only.
+        """
+        self.tick += 1
+        near = pygame.Rect(camera_x - self.margin, 0, SCREEN_WIDTH + 2 * self.margin, SCREEN_HEIGHT)
+        full, coarse = [], []
+        for monster in monsters:
+            if monster.lod_phase is None:
+                monster.lod_phase = self.next_phase % self.interval
+                self.next_phase += 1
+            (full if near.colliderect(monster.rect) else coarse).append(monster)
+        self.counts = [len(full), len(coarse)]
+
+        start = time.perf_counter()
+        if swarm:
+            swarm.steer(full)
+        for monster in full:
+            if monster.lod_pending:
+                # Catch up on ticks missed while far away before switching back
+                monster.update_coarse(wall_grid, monster.lod_pending)
+                monster.lod_pending = 0
+                if not monster.alive():
+                    continue
+            animate = animate_view is None or animate_view.colliderect(monster.rect)
+            monster.update(walls, animate)
+        middle = time.perf_counter()
+        for monster in coarse:
+            monster.lod_pending += 1
+            if (self.tick + monster.lod_phase) % self.interval == 0:
+                monster.update_coarse(wall_grid, monster.lod_pending)
+                monster.lod_pending = 0
+        end = time.perf_counter()
+
+        self.monster_ticks[0] += len(full)
+        self.monster_ticks[1] += len(coarse)
+        self.seconds[0] += middle - start
+        self.seconds[1] += end - middle
+        if LOD_REPORT_INTERVAL and self.tick % LOD_REPORT_INTERVAL == 0:
+            logger.info(self.report())
+
+    def saved_seconds(self):
+        """Estimated CPU time saved by the coarse tier so far."""
+        if not self.monster_ticks[0]:
+            return 0.0
+        full_cost = self.seconds[0] / self.monster_ticks[0]
+        return self.monster_ticks[1] * full_cost - self.seconds[1]
+
+    def report(self):
+        return ("tick %d: %d full, %d coarse monsters; %.2f ms spent in full, %.2f ms in coarse, "
+                "~%.2f ms saved in total"
+                % (self.tick, self.counts[0], self.counts[1], self.seconds[0] * 1000,
+                   self.seconds[1] * 1000, self.saved_seconds() * 1000))
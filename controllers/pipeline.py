@@ -0,0 +1,71 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import PIPELINE_REPORT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationPipeline:
+    """
+    Overlaps simulation and drawing.
+    Each step handles events on the main thread, starts tick N+1 on a worker
+    thread, and meanwhile draws the Frame snapshot of tick N. The worker is
+    always joined before the next events are handled, so the game state is
+    only touched by one thread at a time and ticks run in the same order with
+    the same inputs as GameController.step: the simulation is unchanged, the
+    picture is just one tick behind.
+    The overlap is only real parallelism where the GIL allows it, that is on
+    free-threaded builds or while pygame releases the GIL inside blits.
+    """
+    def __init__(self, controller):
+        self.controller = controller
+        self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
+        self.frame = None
+        # Tick the pending frame was captured after
+        self.frame_tick = 0
+        self.frames = 0
+        # Totals since the start, in seconds
+        self.sim_seconds = 0.0
+        self.render_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def _simulate(self):
+        start = time.perf_counter()
+        frame = self.controller.simulate()
+        return frame, time.perf_counter() - start
+
+    def step(self):
+        controller = self.controller
+        controller.handle_events()
+        start = time.perf_counter()
+        pending = self.worker.submit(self._simulate)
+        if self.frame is not None:
+            controller.renderer.draw(self.frame, controller.font, controller.title_font)
+            controller.flip(self.frame_tick)
+        render_seconds = time.perf_counter() - start
+        self.frame, sim_seconds = pending.result()
+        self.frame_tick = controller.tick
+        wall_seconds = time.perf_counter() - start
+
+        self.frames += 1
+        self.sim_seconds += sim_seconds
+        self.render_seconds += render_seconds
+        self.wall_seconds += wall_seconds
+        # Split the wall time so the governor sees what the frame really cost
+        controller.record_frame(sim_seconds, max(0.0, wall_seconds - sim_seconds))
+        if PIPELINE_REPORT_INTERVAL and self.frames % PIPELINE_REPORT_INTERVAL == 0:
+            logger.info(self.report())
+
+    def overlap_seconds(self):
+        """Time simulation and drawing ran at the same time, in total."""
+        return max(0.0, self.sim_seconds + self.render_seconds - self.wall_seconds)
+
+    def report(self):
+        n = max(1, self.frames)
+        shorter = min(self.sim_seconds, self.render_seconds)
+        ratio = self.overlap_seconds() / shorter * 100 if shorter else 0.0
+        return ("frame %d: avg sim %.2f ms, render %.2f ms, frame %.2f ms, overlap %.2f ms "
+                "(%.0f%% of the shorter stage)"
+                % (self.frames, self.sim_seconds / n * 1000, self.render_seconds / n * 1000,
+                   self.wall_seconds / n * 1000, self.overlap_seconds() / n * 1000, ratio))
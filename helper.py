@@ -1,8 +1,37 @@
+import weakref
 import pygame
+from surface_tracker import tracker
+
+# Collision masks and horizontally flipped copies, computed once per image
+_masks = weakref.WeakKeyDictionary()
+_flipped = weakref.WeakKeyDictionary()
 
 def load_image(path, size):
-    """Load and scale an image, and set the colorkey for transparency."""
-    image = pygame.image.load(path).convert_alpha()
+    """
+    Load and scale an image, and set the colorkey for transparency.
+    The art is opaque with a (40, 40, 40) background, so images are kept in
+    the display format without alpha and use an RLE-accelerated colorkey,
+    which is the fastest kind of surface to blit.
+    """
+    image = pygame.image.load(path).convert()
     image = pygame.transform.scale(image, size)
-    image.set_colorkey((40, 40, 40))
-    return image
+    image.set_colorkey((40, 40, 40), pygame.RLEACCEL)
+    _masks[image] = pygame.mask.from_surface(image)
+    return tracker.track(image, path)
+
+def get_mask(image):
+    """Collision mask of an image, built on first use and cached."""
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pygame.mask.from_surface(image)
+    return mask
+
+def flip_image(image):
+    """Horizontally flipped copy of an image (with its mask), made once and cached."""
+    flipped = _flipped.get(image)
+    if flipped is None:
+        flipped = pygame.transform.flip(image, True, False)
+        flipped.set_colorkey((40, 40, 40), pygame.RLEACCEL)
+        _masks[flipped] = pygame.mask.from_surface(flipped)
+        _flipped[image] = tracker.track(flipped, "flipped image")
+    return flipped
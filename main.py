@@ -1,14 +1,23 @@
 import sys
+import logging
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, INPUT_LATENCY_TRACKING, LOW_LATENCY_MODE, LOW_LATENCY_VSYNC
 from controllers.game_controller import GameController
+from controllers.input_latency import InputLatency
 
 def main():
+    # Show frame governor decisions on the console
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if LOW_LATENCY_MODE and LOW_LATENCY_VSYNC:
+        # pygame only honours vsync for SCALED or OpenGL windows
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+    else:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("The Dungeon")
 
-    controller = GameController(screen)
+    latency = InputLatency() if INPUT_LATENCY_TRACKING else None
+    controller = GameController(screen, latency)
     controller.run()
 
 if __name__ == "__main__":
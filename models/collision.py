@@ -0,0 +1,179 @@
+import math
+import pygame
+
+
+def sweep_rect(rect, dx, dy, target):
+    """
+    Return the earliest time t in [0, 1] at which `rect` moved by t*(dx, dy)
+    overlaps `target`, or None if it never does during the move.
+    Overlap follows pygame's colliderect rules (touching edges do not count).
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for lo, hi, d, tlo, thi in ((rect.left, rect.right, dx, target.left, target.right),
+                                (rect.top, rect.bottom, dy, target.top, target.bottom)):
+        if d == 0:
+            if lo >= thi or hi <= tlo:
+                return None
+            continue
+        # Open interval of times during which the two spans overlap on this axis
+        t1 = (tlo - hi) / d
+        t2 = (thi - lo) / d
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+        if t2 < t_exit:
+            t_exit = t2
+    if t_exit <= 0 or t_enter >= t_exit or t_enter > 1:
+        return None
+    return t_enter
+
+
+def first_hit(rect, dx, dy, sprites, max_t=1.0):
+    """Return (t, sprite) for the first sprite swept into before max_t, or (None, None)."""
+    area = rect.union(rect.move(dx, dy))
+    best_t, best = None, None
+    for sprite in sprites:
+        if not area.colliderect(sprite.rect):
+            continue
+        t = sweep_rect(rect, dx, dy, sprite.rect)
+        if t is not None and t <= max_t and (best_t is None or t < best_t):
+            best_t, best = t, sprite
+    return best_t, best
+
+
+def mask_hits(sprite, candidates):
+    """Candidates (already rect-colliding with sprite) whose masks overlap sprite's mask."""
+    if not candidates:
+        return candidates
+    mask = sprite.mask
+    x, y = sprite.rect.topleft
+    return [other for other in candidates
+            if mask.overlap(other.mask, (other.rect.x - x, other.rect.y - y))]
+
+
+def harmful_contact(player, monsters, pixel_perfect=True):
+    """
+    First monster (in group order) touching the player that can hurt it, or None.
+    Only one hit counts per tick since it makes the player invulnerable, so
+    masks are checked for live rect hits until one overlaps, and not at all
+    while the player is already invulnerable.
+    """
+    if player.invuln_timer > 0:
+        return None
+    mask = player.mask if pixel_perfect else None
+    x, y = player.rect.topleft
+    for m in pygame.sprite.spritecollide(player, monsters, False):
+        if m.is_dying:
+            continue
+        if mask is None or mask.overlap(m.mask, (m.rect.x - x, m.rect.y - y)):
+            return m
+    return None
+
+
+class WallGrid:
+    """
+    Index of wall sprites by maze cell.
+    Each wall is registered in every cell its rect overlaps, so moving
+    objects only need to look at the cells along their path.
+    """
+    def __init__(self, walls, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        for wall in walls:
+            self.add(wall)
+
+    def _cells_of(self, rect):
+        cs = self.cell_size
+        for col in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for row in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                yield col, row
+
+    def add(self, wall):
+        for key in self._cells_of(wall.rect):
+            self.cells.setdefault(key, []).append(wall)
+
+    def remove(self, wall):
+        for key in self._cells_of(wall.rect):
+            bucket = self.cells.get(key)
+            if bucket and wall in bucket:
+                bucket.remove(wall)
+                if not bucket:
+                    del self.cells[key]
+
+    def walls_near(self, rect):
+        """Walls registered in the cells overlapped by rect."""
+        found = []
+        for key in self._cells_of(rect):
+            for wall in self.cells.get(key, ()):
+                if wall not in found:
+                    found.append(wall)
+        return found
+
+    def traverse(self, x0, y0, x1, y1):
+        """
+        Yield (col, row, t_entry) for every cell crossed by the segment
+        (x0, y0) -> (x1, y1), in order, using a DDA grid walk.
+        """
+        cs = self.cell_size
+        col, row = int(x0 // cs), int(y0 // cs)
+        end_col, end_row = int(x1 // cs), int(y1 // cs)
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx != 0:
+            next_x = (col + (step_x > 0)) * cs
+            t_max_x = (next_x - x0) / dx
+            t_delta_x = cs / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0:
+            next_y = (row + (step_y > 0)) * cs
+            t_max_y = (next_y - y0) / dy
+            t_delta_y = cs / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+        t = 0.0
+        yield col, row, t
+        while (col, row) != (end_col, end_row) and t <= 1:
+            if t_max_x < t_max_y:
+                t = t_max_x
+                t_max_x += t_delta_x
+                col += step_x
+            else:
+                t = t_max_y
+                t_max_y += t_delta_y
+                row += step_y
+            if t > 1:
+                break
+            yield col, row, t
+
+    def sweep(self, rect, dx, dy):
+        """
+        Find the first wall that `rect` hits while moving by (dx, dy).
+        Returns (t, wall) with t in [0, 1], or (None, None).
+        The result is exact for any move length: every wall that the moving
+        rect could touch lies within `margin` cells of a cell crossed by its centre.
+        """
+        cs = self.cell_size
+        margin = -(-max(rect.width, rect.height) // (2 * cs)) or 1
+        cx, cy = rect.centerx, rect.centery
+        area = rect.union(rect.move(dx, dy))
+        best_t, best = None, None
+        tested = set()
+        for col, row, t_entry in self.traverse(cx, cy, cx + dx, cy + dy):
+            # Any earlier hit would have been found from a cell entered before best_t
+            if best_t is not None and t_entry > best_t:
+                break
+            for c in range(col - margin, col + margin + 1):
+                for r in range(row - margin, row + margin + 1):
+                    for wall in self.cells.get((c, r), ()):
+                        if id(wall) in tested:
+                            continue
+                        tested.add(id(wall))
+                        if not area.colliderect(wall.rect):
+                            continue
+                        t = sweep_rect(rect, dx, dy, wall.rect)
+                        if t is not None and (best_t is None or t < best_t):
+                            best_t, best = t, wall
+        return best_t, best
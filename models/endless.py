@@ -0,0 +1,102 @@
+import random
+from collections import deque
+import pygame
+from config import (
+    MAZE_CELL_SIZE, WALL_THICKNESS, SCREEN_WIDTH, ENDLESS_COLUMNS_AHEAD, ENDLESS_COLUMNS_BEHIND
+)
+from models.maze import EllerColumns, Wall, cell_walls
+from models.collision import WallGrid
+
+
+class DungeonStream:
+    """
+    Horizontally endless dungeon for the endless mode.
+    Maze columns are generated with EllerColumns as the camera approaches
+    them, and columns (with their wall sprites) are dropped once they are
+    far enough behind it. Only a fixed window of columns is kept, so memory
+    and per-frame cost do not grow with the distance travelled.
+    The kept columns are closed off on both sides by temporary walls, which
+    move along as columns are added and dropped, so nothing can walk out of
+    the generated maze.
+    """
+    def __init__(self, rows, seed=None, ahead=ENDLESS_COLUMNS_AHEAD, behind=ENDLESS_COLUMNS_BEHIND):
+        self.rows = rows
+        self.ahead = ahead
+        self.behind = behind
+        self.generator = EllerColumns(rows, random.Random(seed))
+        self.first_col = 0
+        # (cells, wall sprites) for each column from first_col onwards
+        self.columns = deque()
+        self.wall_group = pygame.sprite.Group()
+        self.wall_grid = WallGrid((), MAZE_CELL_SIZE)
+        # Full-height walls closing the left and right side of the kept columns.
+        # They move along with the columns, off screen, and have no maze edge
+        # so they cannot be broken.
+        self.left_cap = Wall(0, 0, WALL_THICKNESS, rows * MAZE_CELL_SIZE)
+        self.right_cap = Wall(0, 0, WALL_THICKNESS, rows * MAZE_CELL_SIZE)
+        self._add_walls((self.left_cap, self.right_cap))
+
+    @property
+    def next_col(self):
+        return self.first_col + len(self.columns)
+
+    @property
+    def left(self):
+        """World x of the first column still kept."""
+        return self.first_col * MAZE_CELL_SIZE
+
+    def cell(self, col, row):
+        """The maze cell at (col, row), or None if its column is not kept."""
+        if not self.first_col <= col < self.next_col:
+            return None
+        return self.columns[col - self.first_col][0][row]
+
+    def _add_walls(self, walls):
+        for wall in walls:
+            self.wall_group.add(wall)
+            self.wall_grid.add(wall)
+
+    def _remove_walls(self, walls):
+        for wall in walls:
+            wall.kill()
+            self.wall_grid.remove(wall)
+
+    def _move_cap(self, cap, x):
+        self.wall_grid.remove(cap)
+        cap.rect.x = x
+        self.wall_grid.add(cap)
+
+    def _append_column(self):
+        col = self.next_col
+        cells = self.generator.next_column()
+        walls = []
+        for row, cell in enumerate(cells):
+            walls.extend(cell_walls(col, row, cell, False, row == self.rows - 1))
+        self._add_walls(walls)
+        self.columns.append((cells, walls))
+        # The right side stays closed until the next column is generated
+        self._move_cap(self.right_cap, (col + 1) * MAZE_CELL_SIZE - WALL_THICKNESS)
+
+    def _evict_column(self):
+        _, walls = self.columns.popleft()
+        self._remove_walls(walls)
+        self.first_col += 1
+
+    def advance(self, camera_x):
+        """
+        Generate columns up to `ahead` past the right screen edge and evict
+        those more than `behind` columns left of it.
+        Returns the number of columns evicted.
+        """
+        last_needed = (camera_x + SCREEN_WIDTH) // MAZE_CELL_SIZE + self.ahead
+        while self.next_col <= last_needed:
+            self._append_column()
+        first_needed = max(0, camera_x // MAZE_CELL_SIZE - self.behind)
+        evicted = 0
+        while self.first_col < first_needed:
+            self._evict_column()
+            evicted += 1
+        if evicted:
+            # The first kept column may have openings on its left
+            self._move_cap(self.left_cap, self.left)
+        return evicted
@@ -4,19 +4,31 @@ from config import MAZE_ROWS, MAZE_COLS, MAZE_CELL_SIZE, WALL_THICKNESS, COLOR_W
 from helper import load_image
 from config import WALL_IMAGE_PATH, WALL_H_IMAGE_PATH
 
-class Wall(pygame.sprite.Sprite):
-    def __init__(self, x, y, w, h):
-        super().__init__()
+# Walls of the same size share one image (walls never draw on their image)
+_wall_images = {}
+
+def wall_image(w, h):
+    image = _wall_images.get((w, h))
+    if image is None:
         if WALL_IMAGE_PATH is not None:
-            self.image = load_image(WALL_IMAGE_PATH, (w, h))
             # If horizontal wall and an alternate image is provided, use it
             if w > h and WALL_H_IMAGE_PATH is not None:
-                self.image = load_image(WALL_H_IMAGE_PATH, (w, h + 10))
-                self.image.set_colorkey((40, 40, 40))
+                image = load_image(WALL_H_IMAGE_PATH, (w, h + 10))
+            else:
+                image = load_image(WALL_IMAGE_PATH, (w, h))
         else:
-            self.image = pygame.Surface((w, h))
-            self.image.fill(COLOR_WALL)
+            image = pygame.Surface((w, h))
+            image.fill(COLOR_WALL)
+        _wall_images[(w, h)] = image
+    return image
+
+class Wall(pygame.sprite.Sprite):
+    def __init__(self, x, y, w, h, edge=None):
+        super().__init__()
+        self.image = wall_image(w, h)
         self.rect = self.image.get_rect(topleft=(x, y))
+        # Maze edge this wall stands on: (col, row, side), side as in the cell's walls list
+        self.edge = edge
 
 def generate_maze(cols, rows):
     """
@@ -40,6 +52,30 @@ def generate_maze(cols, rows):
     carve(0, 0)
     return maze
 
+def cell_walls(col, row, cell, last_col, last_row):
+    """
+    Wall sprites for one maze cell. Each cell draws its top and left walls;
+    right and bottom walls are only drawn on the last column and row.
+    """
+    cell_x = col * MAZE_CELL_SIZE
+    cell_y = row * MAZE_CELL_SIZE
+    walls = []
+    # Top wall
+    if cell['walls'][0]:
+        walls.append(Wall(cell_x, cell_y, MAZE_CELL_SIZE, WALL_THICKNESS, (col, row, 0)))
+    # Right wall (only for the last column)
+    if cell['walls'][1] and last_col:
+        walls.append(Wall(cell_x + MAZE_CELL_SIZE - WALL_THICKNESS, cell_y, WALL_THICKNESS, MAZE_CELL_SIZE,
+                          (col, row, 1)))
+    # Bottom wall (only for the last row)
+    if cell['walls'][2] and last_row:
+        walls.append(Wall(cell_x, cell_y + MAZE_CELL_SIZE - WALL_THICKNESS, MAZE_CELL_SIZE, WALL_THICKNESS,
+                          (col, row, 2)))
+    # Left wall
+    if cell['walls'][3]:
+        walls.append(Wall(cell_x, cell_y, WALL_THICKNESS, MAZE_CELL_SIZE, (col, row, 3)))
+    return walls
+
 def generate_maze_walls(maze):
     """
     Create wall sprites based on the maze structure.
@@ -47,19 +83,101 @@ def generate_maze_walls(maze):
     walls = pygame.sprite.Group()
     for row in range(MAZE_ROWS):
         for col in range(MAZE_COLS):
-            cell_x = col * MAZE_CELL_SIZE
-            cell_y = row * MAZE_CELL_SIZE
-            cell = maze[row][col]
-            # Top wall
-            if cell['walls'][0]:
-                walls.add(Wall(cell_x, cell_y, MAZE_CELL_SIZE, WALL_THICKNESS))
-            # Right wall (only for the last column)
-            if cell['walls'][1] and col == MAZE_COLS - 1:
-                walls.add(Wall(cell_x + MAZE_CELL_SIZE - WALL_THICKNESS, cell_y, WALL_THICKNESS, MAZE_CELL_SIZE))
-            # Bottom wall (only for the last row)
-            if cell['walls'][2] and row == MAZE_ROWS - 1:
-                walls.add(Wall(cell_x, cell_y + MAZE_CELL_SIZE - WALL_THICKNESS, MAZE_CELL_SIZE, WALL_THICKNESS))
-            # Left wall
-            if cell['walls'][3]:
-                walls.add(Wall(cell_x, cell_y, WALL_THICKNESS, MAZE_CELL_SIZE))
+            walls.add(cell_walls(col, row, maze[row][col], col == MAZE_COLS - 1, row == MAZE_ROWS - 1))
     return walls
+
+# Neighbour across each side of a cell, and the side that faces back: side -> (dcol, drow, side)
+_ACROSS = {0: (0, -1, 2), 1: (1, 0, 3), 2: (0, 1, 0), 3: (-1, 0, 1)}
+
+class MazeWalls:
+    """
+    Breakable maze walls.
+    Breaking a wall only touches that sprite, the WallGrid cells it was
+    registered in and the wall flags of the two maze cells it separates, so
+    the cost does not depend on the size of the maze. Walls on the outer
+    edge of the maze cannot be broken.
+    """
+    def __init__(self, cell, wall_grid, rows, cols=None):
+        # cell(col, row) returns the maze cell, or None if it is not kept (endless mode)
+        self.cell = cell
+        self.wall_grid = wall_grid
+        self.rows = rows
+        # None: no right edge (endless mode)
+        self.cols = cols
+        self.broken = 0
+
+    def is_breakable(self, wall):
+        if wall.edge is None:
+            return False
+        col, row, side = wall.edge
+        dcol, drow, _ = _ACROSS[side]
+        col, row = col + dcol, row + drow
+        return 0 <= row < self.rows and col >= 0 and (self.cols is None or col < self.cols)
+
+    def break_wall(self, wall):
+        """Remove a wall from the maze. Returns False for outer and already broken walls."""
+        if not wall.alive() or not self.is_breakable(wall):
+            return False
+        wall.kill()
+        self.wall_grid.remove(wall)
+        col, row, side = wall.edge
+        dcol, drow, opposite = _ACROSS[side]
+        for c, r, s in ((col, row, side), (col + dcol, row + drow, opposite)):
+            cell = self.cell(c, r)
+            if cell is not None:
+                cell['walls'][s] = False
+        self.broken += 1
+        return True
+
+class EllerColumns:
+    """
+    Endless maze generated one column at a time with Eller's algorithm.
+    Only the set membership of the current column is kept, so memory is
+    O(rows) however many columns are generated. Cells use the same format
+    as generate_maze; the result is a perfect maze (no loops, all connected).
+    """
+    def __init__(self, rows, rng, join_chance=0.5, carve_chance=0.5):
+        self.rows = rows
+        self.rng = rng
+        self.join_chance = join_chance
+        self.carve_chance = carve_chance
+        self.sets = [None] * rows
+        self.next_set = 0
+        # Which rows have a passage coming in from the previous column
+        self.left_open = [False] * rows
+
+    def next_column(self):
+        rows, rng, sets = self.rows, self.rng, self.sets
+        for r in range(rows):
+            if sets[r] is None:
+                sets[r] = self.next_set
+                self.next_set += 1
+        column = [{'visited': True, 'walls': [True, True, True, not self.left_open[r]]}
+                  for r in range(rows)]
+
+        # Randomly join vertically adjacent cells that are not yet connected
+        for r in range(rows - 1):
+            if sets[r] != sets[r + 1] and rng.random() < self.join_chance:
+                column[r]['walls'][2] = False
+                column[r + 1]['walls'][0] = False
+                old = sets[r + 1]
+                for i in range(rows):
+                    if sets[i] == old:
+                        sets[i] = sets[r]
+
+        # Every set must continue into the next column at least once
+        members = {}
+        for r in range(rows):
+            members.setdefault(sets[r], []).append(r)
+        right_open = [False] * rows
+        for group in members.values():
+            forced = rng.choice(group)
+            for r in group:
+                if r == forced or rng.random() < self.carve_chance:
+                    right_open[r] = True
+        for r in range(rows):
+            column[r]['walls'][1] = not right_open[r]
+            if not right_open[r]:
+                sets[r] = None
+        self.left_open = right_open
+        return column
@@ -5,7 +5,8 @@ from config import (
     MONSTER_WALK_FRAMES, MONSTER_ANIM_SPEED,
     COLOR_MONSTER, MONSTER_KNOCKBACK_IMAGE_PATH, MONSTER_KNOCKBACK_DURATION
 )
-from helper import load_image
+from helper import load_image, get_mask, flip_image
+from telemetry import telemetry, MONSTER_HIT, MONSTER_KILL, MONSTER_DESPAWN
 
 class Monster(pygame.sprite.Sprite):
     def __init__(self, pos):
@@ -16,8 +17,10 @@ class Monster(pygame.sprite.Sprite):
         else:
             self.normal_image = pygame.Surface((MONSTER_SIZE, MONSTER_SIZE))
             self.normal_image.fill(COLOR_MONSTER)
-        self.image = self.normal_image.copy()
+        self.image = self.normal_image
         self.rect = self.image.get_rect(center=pos)
+        self._mask_image = None
+        self._mask = None
 
         # Load walking animation frames (assets/monster-walk/1.png ~ MONSTER_WALK_FRAMES.png)
         self.walk_frames = []
@@ -66,6 +69,18 @@ class Monster(pygame.sprite.Sprite):
         self.is_dying = False
         self.death_velocity = pygame.math.Vector2(0, 0)
 
+        # Level-of-detail bookkeeping: ticks not yet simulated while far away
+        self.lod_pending = 0
+        self.lod_phase = None
+
+    @property
+    def mask(self):
+        # Collision mask of the current image; masks are cached per image
+        if self._mask_image is not self.image:
+            self._mask_image = self.image
+            self._mask = get_mask(self.image)
+        return self._mask
+
     def hit(self, knockback_velocity):
         """
         Called when the monster is hit:
@@ -82,17 +97,20 @@ class Monster(pygame.sprite.Sprite):
             self.attack_delay = random.randint(180, 600)
             self.velocity = pygame.math.Vector2(MONSTER_SPEED, 0).rotate(random.uniform(0, 360))
 
+        telemetry.record(MONSTER_HIT, 0.0, *self.rect.center, self.health - 1)
         if self.health == 2:
             self.health = 1
             self.knockback_timer = MONSTER_KNOCKBACK_DURATION
             self.knockback_velocity = knockback_velocity
-            self.image = self.knockback_image.copy()
+            self.image = self.knockback_image
         else:
+            telemetry.record(MONSTER_KILL, 0.0, *self.rect.center)
             self.is_dying = True
             self.death_frame_index = 0
             self.death_velocity = knockback_velocity
 
-    def update(self, walls):
+    def update(self, walls, animate=True):
+        # animate=False skips walk-frame advancement (used for far-away monsters)
         if self.is_dying:
             # Death state: move using death_velocity and play death animation.
             old_x = self.rect.x
@@ -110,6 +128,7 @@ class Monster(pygame.sprite.Sprite):
 
             self.death_frame_index += self.death_anim_speed
             if self.death_frame_index >= len(self.death_frames):
+                telemetry.record(MONSTER_DESPAWN, 0.0, *self.rect.center)
                 self.kill()
             else:
                 self.image = self.death_frames[int(self.death_frame_index)]
@@ -129,7 +148,7 @@ class Monster(pygame.sprite.Sprite):
                     break
             self.knockback_timer -= 1
             if self.knockback_timer <= 0:
-                self.image = self.normal_image.copy()
+                self.image = self.normal_image
         else:
             if self.is_attacking:
                 self.attack_frame_index += self.attack_anim_speed
@@ -137,7 +156,7 @@ class Monster(pygame.sprite.Sprite):
                     self.is_attacking = False
                     self.attack_frame_index = 0
                     self.attack_delay = random.randint(180, 600)
-                    self.image = self.normal_image.copy()
+                    self.image = self.normal_image
                     self.velocity = pygame.math.Vector2(MONSTER_SPEED, 0).rotate(random.uniform(0, 360))
                 else:
                     self.image = self.attack_frames[int(self.attack_frame_index)]
@@ -163,15 +182,72 @@ class Monster(pygame.sprite.Sprite):
                             self.velocity.y *= -1
                             break
 
-                    if self.velocity.length() > 0:
-                        self.current_frame += self.animation_speed
-                        if self.current_frame >= len(self.walk_frames):
+                    if animate:
+                        if self.velocity.length() > 0:
+                            self.current_frame += self.animation_speed
+                            if self.current_frame >= len(self.walk_frames):
+                                self.current_frame = 0
+                            new_image = self.walk_frames[int(self.current_frame)]
+                            if self.velocity.x < 0:
+                                new_image = flip_image(new_image)
+                            self.image = new_image
+                        else:
                             self.current_frame = 0
-                        new_image = self.walk_frames[int(self.current_frame)]
-                        if self.velocity.x < 0:
-                            new_image = pygame.transform.flip(new_image, True, False)
-                            new_image.set_colorkey((40, 40, 40))
-                        self.image = new_image
-                    else:
-                        self.current_frame = 0
-                        self.image = self.normal_image.copy()
+                            self.image = self.normal_image
+
+    def update_coarse(self, wall_grid, ticks):
+        """
+        Cheap update for monsters far from the camera, covering `ticks` ticks at once.
+        Timers advance as in update(), movement is checked only against walls in
+        the nearby maze cells, and animation frames and images are left alone.
+        """
+        if self.is_dying:
+            self._move_coarse(wall_grid, self.death_velocity, ticks, bounce=False)
+            self.death_frame_index += self.death_anim_speed * ticks
+            if self.death_frame_index >= len(self.death_frames):
+                telemetry.record(MONSTER_DESPAWN, 0.0, *self.rect.center)
+                self.kill()
+        elif self.knockback_timer > 0:
+            ticks = min(ticks, self.knockback_timer)
+            self._move_coarse(wall_grid, self.knockback_velocity, ticks, bounce=False)
+            self.knockback_timer -= ticks
+        elif self.is_attacking:
+            self.attack_frame_index += self.attack_anim_speed * ticks
+            if self.attack_frame_index >= len(self.attack_frames):
+                self.is_attacking = False
+                self.attack_frame_index = 0
+                self.attack_delay = random.randint(180, 600)
+                self.velocity = pygame.math.Vector2(MONSTER_SPEED, 0).rotate(random.uniform(0, 360))
+        else:
+            # The monster walks until its attack delay runs out, then stops to attack
+            moving = min(ticks, self.attack_delay - 1)
+            self.attack_delay -= ticks
+            if moving > 0:
+                self._move_coarse(wall_grid, self.velocity, moving, bounce=True)
+            if self.attack_delay <= 0:
+                self.is_attacking = True
+                self.attack_frame_index = 0
+                self.velocity = pygame.math.Vector2(0, 0)
+
+    def _move_coarse(self, wall_grid, velocity, ticks, bounce):
+        # Knockback/death moves use whole pixels; walking adds the float velocity
+        # to the rect, so take the per-tick step the rect would actually make.
+        if bounce:
+            probe = self.rect.move(0, 0)
+            probe.x += velocity.x
+            probe.y += velocity.y
+            steps = (probe.x - self.rect.x, probe.y - self.rect.y)
+        else:
+            steps = (int(velocity.x), int(velocity.y))
+        for axis in (0, 1):
+            if steps[axis] == 0:
+                continue
+            old = self.rect.topleft
+            if axis == 0:
+                self.rect.x += steps[0] * ticks
+            else:
+                self.rect.y += steps[1] * ticks
+            if any(self.rect.colliderect(w.rect) for w in wall_grid.walls_near(self.rect)):
+                self.rect.topleft = old
+                if bounce:
+                    velocity[axis] *= -1
@@ -6,7 +6,7 @@ from config import (
     WORLD_WIDTH, WORLD_HEIGHT, FPS,
     KNOCKBACK_SPEED, KNOCKBACK_DURATION
 )
-from helper import load_image
+from helper import load_image, get_mask, flip_image
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, pos):
@@ -20,9 +20,13 @@ class Player(pygame.sprite.Sprite):
             self.knockback_image = load_image(PLAYER_KNOCKBACK_IMAGE_PATH, (PLAYER_SIZE, PLAYER_SIZE))
         else:
             self.knockback_image = None
-        self.image = self.normal_image.copy()
+        self.image = self.normal_image
         self.rect = self.image.get_rect(center=pos)
+        self._mask_image = None
+        self._mask = None
         self.lives = PLAYER_LIVES
+        # Area the player is kept inside (moves with the dungeon in endless mode)
+        self.bounds = pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)
         self.invuln_timer = 0
         # Initial direction is to the right
         self.direction = pygame.math.Vector2(1, 0)
@@ -59,11 +63,21 @@ class Player(pygame.sprite.Sprite):
         self.current_frame = 0
         self.animation_speed = 0.2
 
-    def update(self, walls):
+    @property
+    def mask(self):
+        # Collision mask of the current image; masks are cached per image
+        if self._mask_image is not self.image:
+            self._mask_image = self.image
+            self._mask = get_mask(self.image)
+        return self._mask
+
+    def update(self, walls, keys=None):
+        # keys: pressed-key state sampled by the controller; read it here if not given
         if self.knockback_timer > 0:
             if self.knockback_image:
-                self.image = self.knockback_image.copy()
+                self.image = self.knockback_image
             else:
+                self.image = self.normal_image.copy()
                 self.image.fill(COLOR_PLAYER_HIT)
             old_x = self.rect.x
             self.rect.x += int(self.knockback_vel.x)
@@ -80,16 +94,16 @@ class Player(pygame.sprite.Sprite):
                 self.is_attacking = False
                 self.attack_anim_index = 0
                 self.arrow_spawned = False
-                self.image = self.normal_image.copy()
+                self.image = self.normal_image
             else:
                 new_image = self.attack_frames[int(self.attack_anim_index)]
                 # Flip the attack frame if needed based on last horizontal direction
                 if self.last_horizontal < 0:
-                    new_image = pygame.transform.flip(new_image, True, False)
-                    new_image.set_colorkey((40,40,40))
+                    new_image = flip_image(new_image)
                 self.image = new_image
         else:
-            keys = pygame.key.get_pressed()
+            if keys is None:
+                keys = pygame.key.get_pressed()
             dx = dy = 0
             if keys[pygame.K_LEFT]:
                 dx = -PLAYER_SPEED
@@ -109,15 +123,13 @@ class Player(pygame.sprite.Sprite):
                     self.current_frame = 0
                 new_image = self.walk_frames[int(self.current_frame)]
                 if self.last_horizontal < 0:
-                    new_image = pygame.transform.flip(new_image, True, False)
-                    new_image.set_colorkey((40,40,40))
+                    new_image = flip_image(new_image)
                 self.image = new_image
             else:
                 if self.last_horizontal < 0:
-                    self.image = pygame.transform.flip(self.normal_image, True, False)
-                    self.image.set_colorkey((40,40,40))
+                    self.image = flip_image(self.normal_image)
                 else:
-                    self.image = self.normal_image.copy()
+                    self.image = self.normal_image
                 self.current_frame = 0
 
             self.rect.x += dx
@@ -135,10 +147,7 @@ class Player(pygame.sprite.Sprite):
                     elif dy < 0:
                         self.rect.top = wall.rect.bottom
 
-            self.rect.left = max(0, self.rect.left)
-            self.rect.top = max(0, self.rect.top)
-            self.rect.right = min(WORLD_WIDTH, self.rect.right)
-            self.rect.bottom = min(WORLD_HEIGHT, self.rect.bottom)
+            self.rect.clamp_ip(self.bounds)
 
         if self.invuln_timer > 0:
             self.invuln_timer -= 1
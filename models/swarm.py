@@ -0,0 +1,106 @@
+import math
+import random
+from itertools import chain
+from config import (
+    MONSTER_SPEED, SWARM_RADIUS, SEPARATION_RADIUS, SWARM_MAX_NEIGHBOURS, SWARM_MAX_CHECKS,
+    SEPARATION_WEIGHT, COHESION_WEIGHT, ALIGNMENT_WEIGHT
+)
+
+# The 3x3 block of grid cells around a monster's cell, its own cell first:
+# monsters sharing a cell overlap the most and must not be cut off by the caps
+_OFFSETS = [(0, 0)] + [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class Swarm:
+    """
+    Separation and loose flocking for walking monsters.
+    Monsters are bucketed into a grid of SWARM_RADIUS-sized cells every tick,
+    so each one only looks at monsters in the 3x3 cells around it. It stops
+    after max_neighbours monsters within the radius or max_checks distance
+    checks, whichever comes first, so per-tick cost is linear in the number
+    of monsters however tightly they are packed.
+    """
+    def __init__(self, radius=SWARM_RADIUS, separation_radius=SEPARATION_RADIUS,
+                 max_neighbours=SWARM_MAX_NEIGHBOURS, max_checks=SWARM_MAX_CHECKS,
+                 separation=SEPARATION_WEIGHT, cohesion=COHESION_WEIGHT,
+                 alignment=ALIGNMENT_WEIGHT):
+        self.radius = radius
+        self.separation_radius = separation_radius
+        self.max_neighbours = max_neighbours
+        self.max_checks = max_checks
+        self.separation = separation
+        self.cohesion = cohesion
+        self.alignment = alignment
+        self.cells = {}
+        # Neighbour distance checks in the last steer() call
+        self.checks = 0
+
+    def rebuild(self, monsters):
+        r = self.radius
+        cells = {}
+        for monster in monsters:
+            if not monster.is_dying:
+                x, y = monster.rect.center
+                cells.setdefault((x // r, y // r), []).append(monster)
+        self.cells = cells
+
+    def steer(self, monsters):
+        """
+        Adjust the velocity of every walking monster; call once per tick before
+        updating them. Only the given monsters are neighbours of each other, so
+        the caller can leave out monsters it does not simulate in full.
+        """
+        self.rebuild(monsters)
+        cells = self.cells
+        r = self.radius
+        radius_sq = r * r
+        separation_sq = self.separation_radius * self.separation_radius
+        max_neighbours = self.max_neighbours
+        max_checks = self.max_checks
+        checks = 0
+        for monster in monsters:
+            if monster.is_dying or monster.is_attacking or monster.knockback_timer > 0:
+                continue
+            x, y = monster.rect.center
+            cx, cy = x // r, y // r
+            nearby = chain.from_iterable(cells.get((cx + dx, cy + dy), ()) for dx, dy in _OFFSETS)
+            count = seen = 0
+            sep_x = sep_y = pos_x = pos_y = vel_x = vel_y = 0.0
+            for other in nearby:
+                if other is monster:
+                    continue
+                if count == max_neighbours or seen == max_checks:
+                    break
+                seen += 1
+                ox, oy = other.rect.center
+                dx, dy = x - ox, y - oy
+                dist_sq = dx * dx + dy * dy
+                if dist_sq > radius_sq:
+                    continue
+                count += 1
+                pos_x += ox
+                pos_y += oy
+                vel_x += other.velocity.x
+                vel_y += other.velocity.y
+                if dist_sq < separation_sq:
+                    # Push away harder the closer the neighbour is
+                    if dist_sq == 0:
+                        # Same centre (e.g. both spawned in one cell): each picks its own
+                        # way out, or the pair would get identical pushes and never part
+                        angle = random.uniform(0, 2 * math.pi)
+                        dx, dy, dist_sq = math.cos(angle), math.sin(angle), 1
+                    sep_x += dx / dist_sq
+                    sep_y += dy / dist_sq
+            checks += seen
+            if not count:
+                continue
+            velocity = monster.velocity
+            velocity.x += (sep_x * self.separation_radius * self.separation
+                           + (pos_x / count - x) * self.cohesion
+                           + (vel_x / count - velocity.x) * self.alignment)
+            velocity.y += (sep_y * self.separation_radius * self.separation
+                           + (pos_y / count - y) * self.cohesion
+                           + (vel_y / count - velocity.y) * self.alignment)
+            if velocity.length_squared() > 0:
+                velocity.scale_to_length(MONSTER_SPEED)
+        self.checks = checks
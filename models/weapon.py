@@ -1,6 +1,6 @@
 import math
 import pygame
-from config import PLAYER_SIZE, FIST_SPEED
+from config import PLAYER_SIZE, FIST_SPEED, ARROW_SPEED
 from helper import load_image
 
 class Fist(pygame.sprite.Sprite):
@@ -13,6 +13,8 @@ class Fist(pygame.sprite.Sprite):
         self.width = 20 + player.attack_range_boost
         self.length = 30 + player.attack_range_boost
         self.wall_group = wall_group
+        # Powered-up fists can break walls (see DESTRUCTIBLE_WALLS)
+        self.powered = player.attack_range_boost > 0
         from config import FIST_IMAGE_PATH  # Avoid circular imports
         if FIST_IMAGE_PATH:
             self.original_image = load_image(FIST_IMAGE_PATH, (self.width, self.length))
@@ -38,24 +40,32 @@ class Fist(pygame.sprite.Sprite):
             # Fist passes through walls; no collision check here.
 
 class Arrow(pygame.sprite.Sprite):
-    def __init__(self, pos, direction, wall_group):
+    def __init__(self, pos, direction, wall_grid):
         super().__init__()
         self.direction = direction.normalize()
         # Adjust arrow size
-        self.speed = FIST_SPEED * 2.5  # Faster arrow speed
-        self.wall_group = wall_group
+        self.speed = ARROW_SPEED
+        self.wall_grid = wall_grid
         self.image = load_image("assets/arrow.png", (PLAYER_SIZE//2, PLAYER_SIZE//4))
         # Rotate arrow to point in the movement direction
         angle = math.degrees(math.atan2(-self.direction.y, self.direction.x))
         self.image = pygame.transform.rotate(self.image, angle)
         self.image.set_colorkey((40,40,40))
         self.rect = self.image.get_rect(center=pos)
+        # Swept movement of the last update, used for collision checks
+        self.prev_rect = self.rect.copy()
+        self.move = (0, 0)
+        self.wall_hit_t = None
+        self.wall_hit = None
 
     def update(self):
-        self.rect.x += int(self.direction.x * self.speed)
-        self.rect.y += int(self.direction.y * self.speed)
-        # Arrow cannot pass through walls – check for collisions
-        for wall in self.wall_group:
-            if self.rect.colliderect(wall.rect):
-                self.kill()
-                break
+        dx = int(self.direction.x * self.speed)
+        dy = int(self.direction.y * self.speed)
+        self.prev_rect = self.rect.copy()
+        self.move = (dx, dy)
+        # Arrow cannot pass through walls – sweep along the whole move so
+        # fast arrows cannot skip over thin walls between two ticks
+        self.wall_hit_t, self.wall_hit = self.wall_grid.sweep(self.rect, dx, dy)
+        self.rect.move_ip(dx, dy)
+        if self.wall_hit is not None:
+            self.kill()
@@ -0,0 +1,91 @@
+import atexit
+import logging
+import sys
+import time
+import weakref
+from collections import defaultdict
+from config import SURFACE_TRACKING, SURFACE_TRACKING_REPORT_AT_EXIT
+
+logger = logging.getLogger(__name__)
+
+
+def _caller_owner(depth):
+    """Name the type of the first `self` found up the call stack, or the module."""
+    frame = sys._getframe(depth)
+    module = frame.f_globals.get('__name__', '?')
+    while frame is not None:
+        owner = frame.f_locals.get('self')
+        if owner is not None and not isinstance(owner, SurfaceTracker):
+            return type(owner).__name__
+        frame = frame.f_back
+    return module
+
+
+class SurfaceTracker:
+    """
+    Accounts for the memory held by Surfaces.
+    Every tracked Surface is recorded with its byte size, the asset it came
+    from and the type of the object that created it. A weakref finalizer
+    notes when it is freed, so live memory and lifetimes can be reported.
+    """
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.live = {}
+        # Surfaces already recorded, so tracking one twice does not count it twice
+        self.tracked = weakref.WeakKeyDictionary()
+        self.next_key = 0
+        self.created = 0
+        self.freed = 0
+        self.freed_lifetime = 0.0
+        self.live_bytes = 0
+        self.peak_bytes = 0
+
+    def track(self, surface, asset, owner=None):
+        """Record a Surface (once); returns it unchanged so calls can be chained."""
+        if not self.enabled or surface in self.tracked:
+            return surface
+        if owner is None:
+            owner = _caller_owner(2)
+        key = self.next_key
+        self.next_key += 1
+        self.tracked[surface] = key
+        size = surface.get_pitch() * surface.get_height()
+        self.live[key] = (asset, owner, size, time.perf_counter())
+        self.created += 1
+        self.live_bytes += size
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+        weakref.finalize(surface, self._release, key)
+        return surface
+
+    def _release(self, key):
+        entry = self.live.pop(key, None)
+        if entry is None:
+            return
+        self.freed += 1
+        self.live_bytes -= entry[2]
+        self.freed_lifetime += time.perf_counter() - entry[3]
+
+    def breakdown(self, field):
+        """Live (bytes, count) per asset (field=0) or per owner type (field=1), largest first."""
+        totals = defaultdict(lambda: [0, 0])
+        for entry in self.live.values():
+            totals[entry[field]][0] += entry[2]
+            totals[entry[field]][1] += 1
+        return sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+
+    def report(self, limit=10):
+        mean_life = self.freed_lifetime / self.freed if self.freed else 0.0
+        lines = ["%d live surfaces, %.2f MB live, peak %.2f MB; %d created, %d freed (mean lifetime %.2f s)"
+                 % (len(self.live), self.live_bytes / 2**20, self.peak_bytes / 2**20,
+                    self.created, self.freed, mean_life)]
+        for title, field in (("By asset:", 0), ("By owner:", 1)):
+            lines.append(title)
+            for name, (size, count) in self.breakdown(field)[:limit]:
+                lines.append("  %9.1f KB %6d  %s" % (size / 1024, count, name))
+        return "\n".join(lines)
+
+
+tracker = SurfaceTracker(SURFACE_TRACKING)
+
+if SURFACE_TRACKING and SURFACE_TRACKING_REPORT_AT_EXIT:
+    atexit.register(lambda: logger.info("Surface memory at exit:\n%s", tracker.report()))
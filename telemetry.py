@@ -0,0 +1,112 @@
+import atexit
+import os
+import struct
+import threading
+import time
+from config import TELEMETRY_ENABLED, TELEMETRY_CAPACITY, TELEMETRY_FLUSH_INTERVAL, TELEMETRY_DIR
+
+# Record kinds
+TICK = 0            # value: frame ms; a..f: monsters, projectiles, items, lives, kills, keys
+MONSTER_HIT = 1     # a, b: position; c: health left
+MONSTER_KILL = 2    # a, b: position (death animation starts)
+MONSTER_SPAWN = 3   # a, b: position
+MONSTER_DESPAWN = 4 # a, b: position (sprite removed)
+KEY_SPAWN = 5       # a, b: position
+KEY_PICKUP = 6      # a, b: position
+POWERUP_SPAWN = 7   # a, b: position
+POWERUP_PICKUP = 8  # a, b: position
+
+KIND_NAMES = ('tick', 'monster_hit', 'monster_kill', 'monster_spawn', 'monster_despawn',
+              'key_spawn', 'key_pickup', 'powerup_spawn', 'powerup_pickup')
+
+# tick, kind, value, a, b, c, d, e, f
+RECORD = struct.Struct('<IBfiiiiii')
+
+
+class Telemetry:
+    """
+    Fixed-size gameplay records in a preallocated ring buffer.
+    The game thread packs records straight into a bytearray; a background
+    thread copies finished records out and appends them to a binary file.
+    If the writer laps the flusher, the overwritten records are counted as
+    dropped instead of blocking the game.
+    """
+    def __init__(self, enabled, capacity=TELEMETRY_CAPACITY, flush_interval=TELEMETRY_FLUSH_INTERVAL):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.written = 0     # Records written since start (not wrapped)
+        self.flushed = 0     # Records handed to the file so far
+        self.dropped = 0
+        self.tick = 0
+        # Running totals per record kind
+        self.counts = [0] * len(KIND_NAMES)
+        self.path = None
+        self.file = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def record(self, kind, value=0.0, a=0, b=0, c=0, d=0, e=0, f=0):
+        if not self.enabled:
+            return
+        RECORD.pack_into(self.buffer, (self.written % self.capacity) * RECORD.size,
+                         self.tick, kind, value, a, b, c, d, e, f)
+        self.written += 1
+        self.counts[kind] += 1
+
+    def start(self, directory=TELEMETRY_DIR):
+        """Open the output file and start the flush thread (once)."""
+        if not self.enabled or self.thread is not None:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, time.strftime("telemetry-%Y%m%d-%H%M%S.bin"))
+        self.file = open(self.path, 'wb')
+        self.thread = threading.Thread(target=self._flush_loop, name="telemetry", daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+        self.file.close()
+
+    def _flush_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        written = self.written
+        start = max(self.flushed, written - self.capacity)
+        self.dropped += start - self.flushed
+        if written == start:
+            return
+        first = start % self.capacity
+        last = written % self.capacity
+        if first < last:
+            data = bytes(self.buffer[first * RECORD.size:last * RECORD.size])
+        else:
+            data = bytes(self.buffer[first * RECORD.size:]) + bytes(self.buffer[:last * RECORD.size])
+        # Records overwritten while we were copying are unreliable: skip them
+        overrun = self.written - self.capacity - start
+        if overrun > 0:
+            self.dropped += overrun
+            data = data[overrun * RECORD.size:]
+        self.file.write(data)
+        self.file.flush()
+        self.flushed = written
+
+
+def read_records(path):
+    """Yield (tick, kind name, value, a, b, c, d, e, f) tuples from a telemetry file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    for tick, kind, *rest in RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size]):
+        yield (tick, KIND_NAMES[kind], *rest)
+
+
+telemetry = Telemetry(TELEMETRY_ENABLED)
@@ -0,0 +1,73 @@
+import random
+from collections import OrderedDict
+import pygame
+from surface_tracker import tracker
+
+
+class ChunkedBackground:
+    """
+    Tiled world background that is split into fixed-size chunks.
+    Chunks are generated from the seed the first time they become visible
+    and kept in an LRU cache whose total size is capped in bytes, so memory
+    does not depend on the size of the world.
+    """
+    def __init__(self, tile_images, world_size, chunk_tiles, cache_bytes, seed=None):
+        self.tile_images = tile_images
+        self.tile_width = tile_images[0].get_width()
+        self.tile_height = tile_images[0].get_height()
+        self.world_width, self.world_height = world_size
+        self.chunk_width = self.tile_width * chunk_tiles
+        self.chunk_height = self.tile_height * chunk_tiles
+        self.chunk_tiles = chunk_tiles
+        self.cache_bytes = cache_bytes
+        self.seed = random.randrange(1 << 32) if seed is None else seed
+        self.chunks = OrderedDict()
+        self.used_bytes = 0
+
+    def _build_chunk(self, cx, cy):
+        # Chunks on the right/bottom edge are clipped to the world size
+        x0 = cx * self.chunk_width
+        y0 = cy * self.chunk_height
+        w = min(self.chunk_width, self.world_width - x0)
+        h = min(self.chunk_height, self.world_height - y0)
+        surface = pygame.Surface((w, h)).convert()
+        # String seeds are hashed deterministically, so a chunk always looks the same
+        rng = random.Random(f"{self.seed}:{cx}:{cy}")
+        for tx in range(self.chunk_tiles):
+            for ty in range(self.chunk_tiles):
+                tile = rng.choice(self.tile_images)
+                surface.blit(tile, (tx * self.tile_width, ty * self.tile_height))
+        return surface
+
+    def _surface_bytes(self, surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get_chunk(self, cx, cy):
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        chunk = tracker.track(self._build_chunk(cx, cy), "background chunk", "ChunkedBackground")
+        self.chunks[key] = chunk
+        self.used_bytes += self._surface_bytes(chunk)
+        # Evict least recently used chunks, but always keep the one just built
+        while self.used_bytes > self.cache_bytes and len(self.chunks) > 1:
+            _, old = self.chunks.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(old)
+        return chunk
+
+    def draw(self, screen, camera_x, camera_y=0):
+        """Blit only the chunks that overlap the visible window."""
+        view_w, view_h = screen.get_size()
+        left = max(0, camera_x)
+        top = max(0, camera_y)
+        right = min(self.world_width, camera_x + view_w)
+        bottom = min(self.world_height, camera_y + view_h)
+        if right <= left or bottom <= top:
+            return
+        for cx in range(left // self.chunk_width, (right - 1) // self.chunk_width + 1):
+            for cy in range(top // self.chunk_height, (bottom - 1) // self.chunk_height + 1):
+                chunk = self.get_chunk(cx, cy)
+                screen.blit(chunk, (cx * self.chunk_width - camera_x,
+                                    cy * self.chunk_height - camera_y))
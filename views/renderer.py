@@ -1,13 +1,31 @@
 import os
-import random
+from collections import namedtuple
 import pygame
 from helper import load_image
-from config import WORLD_WIDTH, WORLD_HEIGHT
-from models.item import Endpoint
+from config import (
+    WORLD_WIDTH, WORLD_HEIGHT, BACKGROUND_TILE_SIZE,
+    BACKGROUND_CHUNK_TILES, BACKGROUND_CACHE_BYTES, BACKGROUND_SEED
+)
+from views.background import ChunkedBackground
+from surface_tracker import tracker
+
+# Everything needed to draw one frame, captured at the end of a tick so that
+# drawing does not read live game state (see SimulationPipeline).
+Frame = namedtuple('Frame', 'draw_lists camera_x hud game_over win endpoint_message')
+# Player state shown by the HUD and the direction arrow
+HudState = namedtuple('HudState', 'lives has_key has_bow powerup_timer center direction image_width')
 
 class Renderer:
-    def __init__(self, screen, assets):
-        self.screen = screen
+    # Sprite layers in drawing order; the background is drawn before and the HUD after them
+    LAYERS = ('walls', 'items', 'monsters', 'projectiles', 'player')
+    # HUD layout, right-aligned: one heart per life, then three icon slots below
+    HEART_SPACING = 25
+    ICON_SPACING = 40
+    HUD_MARGIN = 10
+
+    def __init__(self, screen, assets, world_size=(WORLD_WIDTH, WORLD_HEIGHT)):
+        self.screen = tracker.track(screen, "screen")
+        self.screen_width = screen.get_width()
 
         # Check for five types of tile images
         tile_paths = []
@@ -15,21 +33,23 @@ class Renderer:
             path = f"assets/tiles{i}.png"
             if os.path.exists(path):
                 tile_paths.append(path)
+        self.tiled_background = None
+        self.background_image = None
         if tile_paths:
             # Load available tile images and assume a fixed size (adjust as needed)
-            self.tile_images = [load_image(path, (128, 100)) for path in tile_paths]
-            self.tile_width = self.tile_images[0].get_width()
-            self.tile_height = self.tile_images[0].get_height()
-            # Create a background surface by randomly choosing one tile for each cell
-            self.tiled_background = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT))
-            for x in range(0, WORLD_WIDTH, self.tile_width):
-                for y in range(0, WORLD_HEIGHT, self.tile_height):
-                    tile = random.choice(self.tile_images)
-                    self.tiled_background.blit(tile, (x, y))
-            self.background_image = self.tiled_background
-        else:
+            self.tile_images = [load_image(path, BACKGROUND_TILE_SIZE) for path in tile_paths]
+            # Background chunks are generated on demand as they scroll into view
+            self.tiled_background = ChunkedBackground(self.tile_images, world_size,
+                                                      BACKGROUND_CHUNK_TILES, BACKGROUND_CACHE_BYTES,
+                                                      BACKGROUND_SEED)
+        elif assets.get('background') and world_size[0] > WORLD_WIDTH:
+            # Endless world: repeat a screen-sized copy of the background image
+            image = load_image(assets['background'], self.screen.get_size())
+            self.tiled_background = ChunkedBackground([image], world_size, 1, BACKGROUND_CACHE_BYTES,
+                                                      BACKGROUND_SEED)
+        elif assets.get('background'):
             # Fall back to a single background image if no tile images are found.
-            self.background_image = assets.get('background')
+            self.background_image = load_image(assets['background'], world_size)
 
         self.heart_image = assets.get('heart')
         self.no_key_icon = assets.get('no_key')
@@ -40,19 +60,54 @@ class Renderer:
         # Ensure no_key_icon has the correct size and transparency
         self.no_key_icon = load_image("assets/no-key.png", (25, 35))
 
-    def render(self, all_sprites, wall_group, player, endpoint_group, camera_x,
-               game_over, win, endpoint_message, font, title_font):
-        if self.background_image:
+        # Detail settings, lowered by the frame governor under load
+        self.background_detail = True
+        self.hud_interval = 1
+        self.frame_count = 0
+        # The HUD only covers the top-right corner: hearts row plus icon row
+        self.hud_height = self.HUD_MARGIN + (self.heart_image.get_height() if self.heart_image else 25) + 5 + 40
+        # HUD blit list reused while the governor lowers the HUD refresh rate
+        self.hud_cache = None
+
+    def build_draw_list(self, groups, camera_x):
+        """(image, position) pairs for the visible sprites of one layer, in group order."""
+        left = camera_x
+        right = camera_x + self.screen_width
+        return [(sprite.image, (sprite.rect.x - camera_x, sprite.rect.y))
+                for group in groups for sprite in group
+                if sprite.rect.right > left and sprite.rect.left < right]
+
+    def snapshot(self, layers, player, camera_x, game_over, win, endpoint_message):
+        """
+        Capture a Frame from the game state. `layers` maps each name in LAYERS
+        to a list of sprite groups. Only reads state, so it is safe to call
+        from the simulation thread.
+        """
+        hud = HudState(player.lives, player.has_key, player.has_bow, player.powerup_timer,
+                       (player.rect.centerx - camera_x, player.rect.centery),
+                       player.direction.copy(), player.image.get_width())
+        draw_lists = tuple(self.build_draw_list(layers.get(name, ()), camera_x) for name in self.LAYERS)
+        return Frame(draw_lists, camera_x, hud, game_over, win, endpoint_message)
+
+    def render(self, layers, player, camera_x, game_over, win, endpoint_message, font, title_font):
+        """Snapshot the game state and draw it."""
+        self.draw(self.snapshot(layers, player, camera_x, game_over, win, endpoint_message), font, title_font)
+
+    def draw(self, frame, font, title_font):
+        """Draw a Frame; every sprite layer is submitted with a single blits call."""
+        camera_x, game_over, win, endpoint_message = frame.camera_x, frame.game_over, frame.win, frame.endpoint_message
+        hud = frame.hud
+        self.frame_count += 1
+        if not self.background_detail:
+            self.screen.fill(self.bg_color)
+        elif self.tiled_background:
+            self.tiled_background.draw(self.screen, camera_x)
+        elif self.background_image:
             self.screen.blit(self.background_image, (-camera_x, 0))
         else:
             self.screen.fill(self.bg_color)
-        for wall in wall_group:
-            self.screen.blit(wall.image, (wall.rect.x - camera_x, wall.rect.y))
-        for endpoint in endpoint_group:
-            self.screen.blit(endpoint.image, (endpoint.rect.x - camera_x, endpoint.rect.y))
-        for sprite in all_sprites:
-            if not isinstance(sprite, Endpoint):
-                self.screen.blit(sprite.image, (sprite.rect.x - camera_x, sprite.rect.y))
+        for draw_list in frame.draw_lists:
+            self.screen.blits(draw_list, doreturn=False)
         if endpoint_message:
             msg = title_font.render(endpoint_message, True, (255, 0, 0))
             msg_rect = msg.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
@@ -71,35 +126,12 @@ class Renderer:
             msg = font.render("Press R to restart", True, (0, 255, 0))
             msg_rect = msg.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 - 10))
             self.screen.blit(msg, msg_rect)
-        # Top row: display hearts (lives)
-        if self.heart_image:
-            heart_margin_x = 10
-            heart_margin_y = 10
-            heart_spacing = 25
-            for i in range(player.lives):
-                x = self.screen.get_width() - (heart_spacing * (i + 1) + 10)
-                y = heart_margin_y
-                self.screen.blit(self.heart_image, (x, y))
-        # Bottom row: display key, arrow, and powerup icons.
-        bottom_y = 10 + (self.heart_image.get_height() if self.heart_image else 25) + 5
-        icon_spacing = 40
-        x_start = self.screen.get_width() - (icon_spacing * 3 + 10)
-        key_to_show = self.key_icon if player.has_key else self.no_key_icon
-        self.screen.blit(key_to_show, (x_start + 2 * icon_spacing, bottom_y))
-        if player.has_bow:
-            self.screen.blit(self.arrow_icon, (x_start + icon_spacing, bottom_y))
-        if player.powerup_timer > 0:
-            self.screen.blit(self.powerup_icon, (x_start, bottom_y))
-            powerup_seconds = int(player.powerup_timer / 60)
-            timer_text = font.render(str(powerup_seconds), True, (255, 255, 255))
-            timer_rect = timer_text.get_rect(center=(x_start + self.powerup_icon.get_width() // 2,
-                                                      bottom_y + self.powerup_icon.get_height() // 2))
-            self.screen.blit(timer_text, timer_rect)
+        self.draw_hud_layer(hud, font)
 
-        center = pygame.math.Vector2(player.rect.centerx - camera_x, player.rect.centery)
-        player_size = player.image.get_width()
+        center = pygame.math.Vector2(hud.center)
+        player_size = hud.image_width
         offset_distance = player_size / 2
-        D = player.direction.normalize()
+        D = hud.direction.normalize()
         start_point = center + D * offset_distance
         arrow_line_length = 10
         end_point = start_point + D * arrow_line_length
@@ -112,3 +144,49 @@ class Renderer:
         arrow_color = (255, 0, 0)
         pygame.draw.line(self.screen, arrow_color, start_point, end_point, 3)
         pygame.draw.polygon(self.screen, arrow_color, [tip, base_left, base_right])
+
+    def hud_row_width(self, lives):
+        return self.HEART_SPACING * lives + self.HUD_MARGIN
+
+    def draw_hud_layer(self, hud, font):
+        """
+        HUD is drawn every frame, or from a cached blit list rebuilt every
+        hud_interval frames. Caching the list rather than a pixel overlay
+        skips the text rendering and layout without an extra full-area
+        blit, so it is never dearer than drawing the HUD directly.
+        """
+        if self.hud_interval <= 1:
+            self.hud_cache = None
+            self.draw_hud(self.screen, hud, font)
+            return
+        if self.hud_cache is None or self.frame_count % self.hud_interval == 0:
+            self.hud_cache = self.hud_blits(hud, font, self.screen_width)
+        self.screen.blits(self.hud_cache, doreturn=False)
+
+    def draw_hud(self, surface, hud, font):
+        surface.blits(self.hud_blits(hud, font, surface.get_width()), doreturn=False)
+
+    def hud_blits(self, hud, font, width):
+        """(image, position) pairs of the HUD, right-aligned to the given width."""
+        blits = []
+        # Top row: display hearts (lives)
+        if self.heart_image:
+            heart_margin_y = self.HUD_MARGIN
+            blits.extend((self.heart_image, (width - self.hud_row_width(i + 1), heart_margin_y))
+                         for i in range(hud.lives))
+        # Bottom row: display key, arrow, and powerup icons.
+        bottom_y = self.HUD_MARGIN + (self.heart_image.get_height() if self.heart_image else 25) + 5
+        icon_spacing = self.ICON_SPACING
+        x_start = width - (icon_spacing * 3 + self.HUD_MARGIN)
+        key_to_show = self.key_icon if hud.has_key else self.no_key_icon
+        blits.append((key_to_show, (x_start + 2 * icon_spacing, bottom_y)))
+        if hud.has_bow:
+            blits.append((self.arrow_icon, (x_start + icon_spacing, bottom_y)))
+        if hud.powerup_timer > 0:
+            blits.append((self.powerup_icon, (x_start, bottom_y)))
+            powerup_seconds = int(hud.powerup_timer / 60)
+            timer_text = font.render(str(powerup_seconds), True, (255, 255, 255))
+            timer_rect = timer_text.get_rect(center=(x_start + self.powerup_icon.get_width() // 2,
+                                                      bottom_y + self.powerup_icon.get_height() // 2))
+            blits.append((timer_text, timer_rect))
+        return blits